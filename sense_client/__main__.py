@@ -6,6 +6,7 @@ import json
 import os
 import resource
 import time
+from collections import deque
 
 import requests as _requests
 
@@ -14,7 +15,8 @@ from .change_detector import ChangeDetector
 from .roi_extractor import ROIExtractor
 from .ocr import OCRResult, create_ocr
 from .gate import DecisionGate, SenseObservation
-from .sender import SenseSender, package_full_frame, package_roi
+from .sender import (LATENCY_WINDOW, SenseSender, latency_percentiles,
+                     package_full_frame, package_roi)
 from .app_detector import AppDetector
 from .config import load_config
 from .privacy import apply_privacy
@@ -80,6 +82,7 @@ def main():
         url=config["relay"]["url"],
         max_image_kb=config["relay"]["maxImageKB"],
         send_thumbnails=config["relay"]["sendThumbnails"],
+        compression=config["relay"].get("compression"),
     )
     app_detector = AppDetector()
     ocr_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
@@ -112,9 +115,9 @@ def main():
     ocr_errors = 0
     ocr_skipped_backpressure = 0
     shadow_divergences = 0
-    last_stats = time.time()
-    start_time = time.time()
-    event_latencies: list[float] = []
+    last_stats = time.monotonic()
+    start_time = time.monotonic()
+    event_latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
     detect_times: list[float] = []
     ocr_times: list[float] = []
     send_times: list[float] = []
@@ -134,7 +137,7 @@ def main():
         app_changed, window_changed, app_name, window_title = app_detector.detect_change()
 
         # Adaptive SSIM threshold
-        now_sec = time.time()
+        now_sec = time.monotonic()
         if app_changed:
             last_app_change_time = now_sec
             detector.set_threshold(ssim_sensitive_threshold)
@@ -144,9 +147,9 @@ def main():
             log(f"SSIM threshold restored to {ssim_stable_threshold} (stable)")
 
         # 2. Detect frame change
-        t0 = time.time()
+        t0 = time.monotonic()
         change = detector.detect(frame)
-        detect_times.append((time.time() - t0) * 1000)
+        detect_times.append((time.monotonic() - t0) * 1000)
         if len(detect_times) > 500: detect_times.clear()
         if change is None and not app_changed and not window_changed:
             continue
@@ -154,7 +157,7 @@ def main():
         # 3. Extract ROIs + stash as pending
         rois = []
         if change:
-            rois = extractor.extract(frame, change.contours)
+            rois = extractor.extract(frame, change.contours, change.boxes)
             if use_backpressure:
                 pending_frame = frame
                 pending_rois = rois
@@ -176,14 +179,14 @@ def main():
             use_change = change
 
         # 5. OCR on ROIs
-        t0 = time.time()
+        t0 = time.monotonic()
         ocr_result = OCRResult(text="", confidence=0, word_count=0)
         try:
             ocr_result = _run_ocr(ocr, ocr_pool, use_rois)
         except Exception as e:
             ocr_errors += 1
             log(f"OCR error: {e}")
-        ocr_times.append((time.time() - t0) * 1000)
+        ocr_times.append((time.monotonic() - t0) * 1000)
         if len(ocr_times) > 500: ocr_times.clear()
 
         # Shadow validation: run baseline OCR on original frame for comparison
@@ -235,6 +238,8 @@ def main():
             facts.append(f"window: {window_title}")
         if use_change and use_change.ssim_score:
             facts.append(f"ssim: {use_change.ssim_score:.3f}")
+        if use_change and use_change.vertical_motion:
+            facts.append(f"scroll: {use_change.vertical_motion}px")
         if ocr_result.text:
             # Extract first meaningful line as subtitle
             first_line = ocr_result.text.split("\n")[0][:120]
@@ -256,15 +261,14 @@ def main():
             event.roi = package_full_frame(use_frame)
         # Diff images removed — agent doesn't use binary diff masks
 
-        t0 = time.time()
+        t0 = time.monotonic()
         ok = sender.send(event)
-        send_times.append((time.time() - t0) * 1000)
+        send_times.append((time.monotonic() - t0) * 1000)
         if len(send_times) > 500: send_times.clear()
         if ok:
             events_sent += 1
             send_latency = time.time() * 1000 - event.ts
             event_latencies.append(send_latency)
-            if len(event_latencies) > 500: event_latencies.clear()
             ssim = f"{use_change.ssim_score:.3f}" if use_change else "n/a"
             ctx = f"app={app_name}"
             if window_title:
@@ -275,13 +279,11 @@ def main():
             log(f"-> {event.type} FAILED to send")
 
         # Periodic pipeline stats
-        now = time.time()
+        now = time.monotonic()
         if now - last_stats >= 60:
             latency_info = ""
             if event_latencies:
-                sorted_lat = sorted(event_latencies)
-                p50 = sorted_lat[len(sorted_lat) // 2]
-                p95 = sorted_lat[int(len(sorted_lat) * 0.95)]
+                p50, p95 = latency_percentiles(event_latencies)
                 latency_info = f" latency_p50={p50:.0f}ms p95={p95:.0f}ms"
                 event_latencies.clear()
 
@@ -306,7 +308,7 @@ def main():
             snapshot = {
                 "rssMb": round(usage.ru_maxrss / 1048576, 1),
                 "uptimeS": round(now - start_time),
-                "ts": int(now * 1000),
+                "ts": int(time.time() * 1000),
                 "extra": {
                     "capturesOk": capture.stats_ok,
                     "capturesFail": capture.stats_fail,
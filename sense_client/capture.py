@@ -7,6 +7,7 @@ import platform
 import queue
 import threading
 import time
+from collections import deque
 from typing import Generator
 
 import objc
@@ -125,7 +126,11 @@ class SCKCapture:
         self._stats_interval = 60
         self._stream = None
         self._output = None
-        self._queue = queue.Queue(maxsize=3)
+        # Frame handoff from the SCStream callback thread: deque appends are
+        # atomic and maxlen drops the oldest frame, so the loop always sees
+        # the freshest ones; the Event only exists to wake a blocked reader.
+        self._frames: deque[tuple[Image.Image, float]] = deque(maxlen=3)
+        self._frame_ready = threading.Event()
         self._setup_done = False
         self._cv = None  # CoreVideo ctypes handle
         self._cm = None  # CoreMedia ctypes handle
@@ -218,16 +223,16 @@ class SCKCapture:
         # 4. Create ObjC delegate class (once per process)
         if SCKCapture._delegate_cls is None:
             class _SCKStreamOutput(NSObject):
-                """Bridges SCStream async frames to a Python queue."""
+                """Bridges SCStream async frames to the Python frame buffer."""
                 def stream_didOutputSampleBuffer_ofType_(
                         self, stream, sample_buffer, output_type):
                     if output_type != 0:  # 0 = SCStreamOutputTypeScreen
                         return
                     try:
                         img = self._converter(sample_buffer)
-                        self._py_queue.put_nowait((img, time.time()))
+                        self._py_push((img, time.time()))
                     except Exception:
-                        pass  # Drop frame (queue full or conversion error)
+                        pass  # Drop frame (conversion error)
             SCKCapture._delegate_cls = _SCKStreamOutput
 
         # 5. Get shareable content (blocking async → sync via Event)
@@ -284,7 +289,7 @@ class SCKCapture:
             .initWithFilter_configuration_delegate_(content_filter, config, None)
 
         output = SCKCapture._delegate_cls.alloc().init()
-        output._py_queue = self._queue
+        output._py_push = self._push_frame
         output._converter = self._sample_buffer_to_image
         self._output = output  # prevent GC
 
@@ -332,11 +337,31 @@ class SCKCapture:
             self._cv.CVPixelBufferUnlockBaseAddress(pixel_buf,
                                                     _kCVPixelBufferLock_ReadOnly)
 
+    def _push_frame(self, item: tuple[Image.Image, float]) -> None:
+        """Producer side (SCStream callback thread)."""
+        self._frames.append(item)
+        self._frame_ready.set()
+
+    def _next_frame(self, timeout: float) -> tuple[Image.Image, float]:
+        """Consumer side: pop the oldest buffered frame, waiting up to timeout."""
+        try:
+            return self._frames.popleft()
+        except IndexError:
+            pass
+        self._frame_ready.clear()
+        # Re-check after clearing so a frame pushed in between isn't missed
+        if not self._frames and not self._frame_ready.wait(timeout):
+            raise queue.Empty
+        try:
+            return self._frames.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
     def capture_frame(self) -> tuple[Image.Image, float]:
         """Returns (PIL Image, timestamp). Blocks until a frame is available."""
         self._setup()
         try:
-            img, ts = self._queue.get(timeout=2)
+            img, ts = self._next_frame(timeout=2)
             self.stats_ok += 1
             return img, ts
         except queue.Empty:
@@ -349,7 +374,7 @@ class SCKCapture:
         try:
             while True:
                 try:
-                    img, ts = self._queue.get(timeout=2)
+                    img, ts = self._next_frame(timeout=2)
                     self.stats_ok += 1
                     yield img, ts
                 except queue.Empty:
@@ -436,12 +461,16 @@ class ScreenKitCapture:
                 return None
 
             img = Image.open(self.FRAME_PATH)
+            new_size = None
+            if self.scale != 1.0:
+                new_size = (int(img.width * self.scale), int(img.height * self.scale))
+                # Let libjpeg downscale during IDCT (1/2, 1/4, 1/8) so we never
+                # decode the full-resolution frame; resize() handles the rest.
+                img.draft("RGB", new_size)
             img.load()  # Force full read before file can be overwritten
 
-            if self.scale != 1.0:
-                new_w = int(img.width * self.scale)
-                new_h = int(img.height * self.scale)
-                img = img.resize((new_w, new_h), Image.LANCZOS)
+            if new_size is not None and img.size != new_size:
+                img = img.resize(new_size, Image.LANCZOS)
 
             self._last_frame_ts = ts
             self.stats_ok += 1
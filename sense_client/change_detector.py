@@ -1,18 +1,72 @@
 """SSIM-based frame change detection."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 from PIL import Image
 from skimage.metrics import structural_similarity
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeResult:
     ssim_score: float
     diff_image: Image.Image
     contours: list  # list of (y, x) coordinate arrays
     bbox: tuple[int, int, int, int]  # (x, y, w, h)
+    # Per-contour (x1, y1, x2, y2) with inclusive max, aligned with contours
+    boxes: list[tuple[int, int, int, int]] = field(default_factory=list)
+    # Estimated vertical content shift in pixels (>0 = content moved up)
+    vertical_motion: int = 0
+
+
+# Default search range for estimate_vertical_motion, so the per-frame cost
+# stays flat on tall (e.g. 4K) frames instead of growing with n // 4
+MAX_SCROLL_SHIFT = 128
+
+
+def row_profile(gray: np.ndarray) -> np.ndarray:
+    """np.diff of the per-row mean intensity of a grayscale frame."""
+    return np.diff(gray.mean(axis=1))
+
+
+def estimate_vertical_motion(prev: np.ndarray, cur: np.ndarray,
+                             max_shift: int = 0, *,
+                             profiles: tuple[np.ndarray, np.ndarray] | None = None) -> int:
+    """Estimate vertical scroll between two grayscale frames.
+
+    Compares the row profiles (see row_profile) at each shift in
+    [-max_shift, max_shift] and returns the best-matching shift in pixels
+    (positive when content moved up, i.e. scrolled down). Returns 0 when no
+    shift explains the change clearly better than no motion at all.
+    max_shift defaults to min(n // 4, MAX_SCROLL_SHIFT). Callers that
+    already hold both profiles pass them as *profiles* to skip recomputing.
+    """
+    p, c = profiles if profiles is not None else (row_profile(prev), row_profile(cur))
+    n = len(p)
+    if not max_shift:
+        max_shift = min(n // 4, MAX_SCROLL_SHIFT)
+    max_shift = min(max_shift, n // 2)
+    if max_shift < 1:
+        return 0
+
+    base_err = float(np.abs(p - c).mean())
+    if base_err < 1e-3:
+        return 0
+
+    best_shift, best_err = 0, base_err
+    for d in range(1, max_shift + 1):
+        # Content moved up by d: cur[y] == prev[y + d]
+        err_up = float(np.abs(p[d:] - c[:-d]).mean())
+        if err_up < best_err:
+            best_shift, best_err = d, err_up
+        err_down = float(np.abs(p[:-d] - c[d:]).mean())
+        if err_down < best_err:
+            best_shift, best_err = -d, err_down
+
+    # Require a decisive improvement over the no-motion hypothesis
+    if best_err > 0.5 * base_err:
+        return 0
+    return best_shift
 
 
 class ChangeDetector:
@@ -22,6 +76,12 @@ class ChangeDetector:
         self.threshold = threshold
         self.min_area = min_area
         self.prev_frame: np.ndarray | None = None
+        # row_profile(prev_frame), computed once per keyframe
+        self._prev_profile: np.ndarray | None = None
+
+    def _set_keyframe(self, gray: np.ndarray, profile: np.ndarray | None = None) -> None:
+        self.prev_frame = gray
+        self._prev_profile = row_profile(gray) if profile is None else profile
 
     def set_threshold(self, threshold: float) -> None:
         """Dynamically adjust the SSIM change threshold."""
@@ -32,11 +92,11 @@ class ChangeDetector:
         gray = np.array(frame.convert("L"))
 
         if self.prev_frame is None:
-            self.prev_frame = gray
+            self._set_keyframe(gray)
             return None
 
         if gray.shape != self.prev_frame.shape:
-            self.prev_frame = gray
+            self._set_keyframe(gray)
             return None
 
         score, diff_map = structural_similarity(
@@ -46,13 +106,23 @@ class ChangeDetector:
         if score >= self.threshold:
             return None
 
+        profile = row_profile(gray)
+        vertical_motion = estimate_vertical_motion(
+            self.prev_frame, gray, profiles=(self._prev_profile, profile),
+        )
+
         # Keyframe update: only advance prev_frame when change IS detected.
         # This lets diffs accumulate against the last accepted keyframe,
         # which is essential at high FPS where consecutive frames differ by <1%.
-        self.prev_frame = gray
+        self._set_keyframe(gray, profile)
 
         # Convert diff map to binary mask
-        diff_binary = ((1.0 - diff_map) * 255).astype(np.uint8)
+        # In place on the float map: no full-frame temporaries, and clip so
+        # negative SSIM (1 - s > 1) saturates at 255 instead of wrapping.
+        np.subtract(1.0, diff_map, out=diff_map)
+        diff_map *= 255
+        np.clip(diff_map, 0, 255, out=diff_map)
+        diff_binary = diff_map.astype(np.uint8)
         mask = diff_binary > 30  # threshold for "changed" pixels
 
         # Find contours via connected components
@@ -62,18 +132,24 @@ class ChangeDetector:
 
         # Filter by area
         contours = []
+        region_boxes = []
         for region in regions:
             if region.area >= self.min_area:
                 contours.append(region.coords)
+                region_boxes.append(region.bbox)
 
         if not contours:
             return None
 
-        # Compute merged bounding box
-        all_coords = np.vstack(contours)
-        min_y, min_x = all_coords.min(axis=0)
-        max_y, max_x = all_coords.max(axis=0)
+        # Compute merged bounding box from per-region bboxes (max is exclusive)
+        # instead of stacking every changed pixel coordinate
+        table = np.asarray(region_boxes)
+        table[:, 2:] -= 1
+        min_y, min_x = table[:, :2].min(axis=0)
+        max_y, max_x = table[:, 2:].max(axis=0)
         bbox = (int(min_x), int(min_y), int(max_x - min_x), int(max_y - min_y))
+        boxes = [(int(x1), int(y1), int(x2), int(y2))
+                 for y1, x1, y2, x2 in table.tolist()]
 
         diff_img = Image.fromarray(diff_binary)
 
@@ -82,4 +158,6 @@ class ChangeDetector:
             diff_image=diff_img,
             contours=contours,
             bbox=bbox,
+            boxes=boxes,
+            vertical_motion=vertical_motion,
         )
@@ -35,6 +35,7 @@ DEFAULTS = {
         "url": "http://localhost:9500",
         "sendThumbnails": True,
         "maxImageKB": 500,
+        "compression": None,  # "deflate" to compress /sense bodies
     },
     "optimization": {
         "backpressure": False,
@@ -9,7 +9,7 @@ from .change_detector import ChangeResult
 from .ocr import OCRResult
 
 
-@dataclass
+@dataclass(slots=True)
 class SenseMeta:
     ssim: float = 0.0
     app: str = ""
@@ -17,7 +17,7 @@ class SenseMeta:
     screen: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SenseObservation:
     """Structured observation fields (claude-mem compatible schema).
 
@@ -32,7 +32,7 @@ class SenseObservation:
     concepts: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SenseEvent:
     type: str  # "text" | "visual" | "context"
     ts: float = 0.0
@@ -79,9 +79,15 @@ class DecisionGate:
         """Check if text is too similar to any recently sent text."""
         if text == self._last_sent_text:
             return True
+        # SequenceMatcher caches its analysis of seq2, so index the new text
+        # once and swap in each previous text as seq1.
+        matcher = difflib.SequenceMatcher(None, "", text)
         for prev in self._recent_texts:
-            ratio = difflib.SequenceMatcher(None, prev, text).ratio()
-            if ratio > 0.7:
+            matcher.set_seq1(prev)
+            # Cheap upper bounds first; full ratio() only when still possible
+            if matcher.real_quick_ratio() <= 0.7 or matcher.quick_ratio() <= 0.7:
+                continue
+            if matcher.ratio() > 0.7:
                 return True
         return False
 
@@ -11,8 +11,13 @@ try:
 except ImportError:
     pytesseract = None
 
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_HSPACE_RE = re.compile(r"[ \t]+")
+_HAS_ALNUM_RE = re.compile(r"[a-zA-Z0-9]")
+_HAS_ALNUM_CYRILLIC_RE = re.compile(r"[a-zA-Z0-9а-яА-ЯёЁ]")
 
-@dataclass
+
+@dataclass(slots=True)
 class OCRResult:
     text: str
     confidence: float
@@ -71,13 +76,13 @@ class LocalOCR:
     @staticmethod
     def _clean(text: str) -> str:
         """Strip control chars, collapse whitespace, remove noise lines."""
-        text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", text)
-        text = re.sub(r"[ \t]+", " ", text)
+        text = _CONTROL_CHARS_RE.sub("", text)
+        text = _HSPACE_RE.sub(" ", text)
         lines = text.split("\n")
         cleaned = []
         for line in lines:
             line = line.strip()
-            if line and re.search(r"[a-zA-Z0-9]", line):
+            if line and _HAS_ALNUM_RE.search(line):
                 cleaned.append(line)
         return "\n".join(cleaned)
 
@@ -182,12 +187,12 @@ class VisionOCR:
     @staticmethod
     def _clean(text: str) -> str:
         """Collapse whitespace, remove noise lines."""
-        text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", text)
+        text = _CONTROL_CHARS_RE.sub("", text)
         lines = text.split("\n")
         cleaned = []
         for line in lines:
-            line = re.sub(r"[ \t]+", " ", line).strip()
-            if line and re.search(r"[a-zA-Z0-9а-яА-ЯёЁ]", line):
+            line = _HSPACE_RE.sub(" ", line).strip()
+            if line and _HAS_ALNUM_CYRILLIC_RE.search(line):
                 cleaned.append(line)
         return "\n".join(cleaned)
 
@@ -27,6 +27,8 @@ def strip_private(text: str) -> str:
 
 def redact_sensitive(text: str) -> str:
     """Auto-redact patterns that look like secrets or PII."""
+    # Patterns apply one after another: text left over by one redaction
+    # (e.g. a card number after "pwd=") must still be seen by the rest
     for pattern, replacement in _REDACT_PATTERNS:
         text = pattern.sub(replacement, text)
     return text
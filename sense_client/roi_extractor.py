@@ -6,7 +6,7 @@ import numpy as np
 from PIL import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class ROI:
     image: Image.Image
     bbox: tuple[int, int, int, int]  # (x, y, w, h)
@@ -21,18 +21,24 @@ class ROIExtractor:
         self.min_size = min_size
         self.max_rois = max_rois
 
-    def extract(self, frame: Image.Image, contours: list) -> list[ROI]:
-        """Returns list of ROI crops from frame based on contours."""
+    def extract(self, frame: Image.Image, contours: list,
+                boxes: list[tuple[int, int, int, int]] | None = None) -> list[ROI]:
+        """Returns list of ROI crops from frame based on contours.
+
+        `boxes` is the detector's precomputed (x1, y1, x2, y2) table for the
+        same contours; when given, the per-contour min/max pass is skipped.
+        """
         if not contours:
             return []
 
         # Compute bounding boxes for each contour
-        boxes = []
-        for coords in contours:
-            arr = np.array(coords)
-            min_y, min_x = arr.min(axis=0)
-            max_y, max_x = arr.max(axis=0)
-            boxes.append((int(min_x), int(min_y), int(max_x), int(max_y)))
+        if not boxes:
+            boxes = []
+            for coords in contours:
+                arr = np.asarray(coords)
+                min_y, min_x = arr.min(axis=0)
+                max_y, max_x = arr.max(axis=0)
+                boxes.append((int(min_x), int(min_y), int(max_x), int(max_y)))
 
         # Merge overlapping/adjacent boxes
         merged = self._merge_boxes(boxes)
@@ -2,59 +2,121 @@
 
 import base64
 import io
+import json
 import time
+import zlib
+from collections import deque
 
+import numpy as np
 import requests
 from PIL import Image
 
 from .gate import SenseEvent
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from turbojpeg import TJPF_RGB, TurboJPEG
+    _turbojpeg = TurboJPEG()
+except Exception:  # module missing, or libturbojpeg not found at load time
+    _turbojpeg = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+LATENCY_WINDOW = 4096  # samples kept between stats flushes
+
+
+def latency_percentiles(samples) -> tuple[float, float]:
+    """Return (p50, p95) of a non-empty sample buffer.
+
+    np.partition selects both ranks in O(n) instead of sorting.
+    """
+    arr = np.fromiter(samples, dtype=np.float64, count=len(samples))
+    i50, i95 = len(arr) // 2, int(len(arr) * 0.95)
+    arr.partition((i50, i95))
+    return float(arr[i50]), float(arr[i95])
+
+
+def _dumps(payload: dict) -> bytes:
+    """Serialize a payload to JSON bytes (orjson when installed).
+
+    SSIM scores arrive as numpy.float64, hence OPT_SERIALIZE_NUMPY.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload).encode()
+
+
+def _build_payload(event: SenseEvent) -> dict:
+    """Build the /sense JSON body; optional keys are only added when set."""
+    meta = event.meta
+    payload = {
+        "type": event.type,
+        "ts": event.ts,
+        "ocr": event.ocr,
+        "meta": {
+            "ssim": meta.ssim,
+            "app": meta.app,
+            "windowTitle": meta.window_title,
+            "screen": meta.screen,
+        },
+    }
+    if event.roi:
+        payload["roi"] = event.roi
+    if event.diff:
+        payload["diff"] = event.diff
+    obs = event.observation
+    if obs and obs.title:
+        payload["observation"] = {
+            "title": obs.title,
+            "subtitle": obs.subtitle,
+            "facts": obs.facts,
+            "narrative": obs.narrative,
+            "concepts": obs.concepts,
+        }
+    return payload
+
 
 class SenseSender:
     """POSTs sense events to the relay server."""
 
     def __init__(self, url: str = "http://localhost:9500",
-                 max_image_kb: int = 500, send_thumbnails: bool = True):
+                 max_image_kb: int = 500, send_thumbnails: bool = True,
+                 compression: str | None = None):
         self.url = url.rstrip("/")
         self.max_image_kb = max_image_kb
         self.send_thumbnails = send_thumbnails
-        self._latencies: list[float] = []
-        self._last_stats_ts: float = time.time()
+        # "deflate" compresses request bodies (OCR text, base64 thumbnails)
+        # for remote relays; None keeps them raw for localhost.
+        self.compression = compression
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._last_stats_ts: float = time.monotonic()
+        # Keep-alive connection to the relay instead of a new TCP
+        # connection per event
+        self._session = requests.Session()
+        self._session.headers.update(_JSON_HEADERS)
 
     def send(self, event: SenseEvent) -> bool:
         """POST /sense with JSON payload. Returns True on success."""
-        payload = {
-            "type": event.type,
-            "ts": event.ts,
-            "ocr": event.ocr,
-            "meta": {
-                "ssim": event.meta.ssim,
-                "app": event.meta.app,
-                "windowTitle": event.meta.window_title,
-                "screen": event.meta.screen,
-            },
-        }
-        if event.roi:
-            payload["roi"] = event.roi
-        if event.diff:
-            payload["diff"] = event.diff
-        if event.observation and event.observation.title:
-            payload["observation"] = {
-                "title": event.observation.title,
-                "subtitle": event.observation.subtitle,
-                "facts": event.observation.facts,
-                "narrative": event.observation.narrative,
-                "concepts": event.observation.concepts,
-            }
+        payload = _build_payload(event)
 
         try:
-            start = time.time()
-            resp = requests.post(
+            start = time.monotonic()
+            body = _dumps(payload)
+            headers = None
+            if self.compression == "deflate":
+                body = zlib.compress(body, 1)
+                headers = {"Content-Encoding": "deflate"}
+            resp = self._session.post(
                 f"{self.url}/sense",
-                json=payload,
+                data=body,
+                headers=headers,
                 timeout=5,
             )
-            elapsed_ms = (time.time() - start) * 1000
+            elapsed_ms = (time.monotonic() - start) * 1000
             self._latencies.append(elapsed_ms)
             self._maybe_log_stats()
             return resp.status_code == 200
@@ -64,59 +126,98 @@ class SenseSender:
 
     def _maybe_log_stats(self):
         """Log P50/P95 send latencies every 60s."""
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_stats_ts < 60:
             return
         if not self._latencies:
             return
-        sorted_lat = sorted(self._latencies)
-        p50 = sorted_lat[len(sorted_lat) // 2]
-        p95 = sorted_lat[int(len(sorted_lat) * 0.95)]
-        print(f"[sender] relay latency: p50={p50:.0f}ms p95={p95:.0f}ms (n={len(sorted_lat)})")
+        p50, p95 = latency_percentiles(self._latencies)
+        print(f"[sender] relay latency: p50={p50:.0f}ms p95={p95:.0f}ms (n={len(self._latencies)})")
         self._latencies.clear()
         self._last_stats_ts = now
 
 
+def _jpeg_encoder(img: Image.Image):
+    """Return a `quality -> JPEG bytes` function for img.
+
+    Uses libjpeg-turbo (SIMD DCT/colour conversion) when PyTurboJPEG is
+    available, converting the image to an array once for all attempts.
+    The Pillow fallback returns a memoryview over the BytesIO buffer rather
+    than copying it out with getvalue(); b64encode reads it directly.
+    """
+    if _turbojpeg is not None and img.mode == "RGB":
+        arr = np.asarray(img)
+        return lambda quality: _turbojpeg.encode(
+            arr, quality=quality, pixel_format=TJPF_RGB)
+
+    def encode(quality: int) -> bytes | memoryview:
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=quality)
+        return buf.getbuffer()
+    return encode
+
+
 def encode_image(img: Image.Image, max_kb: int, max_px: int = 0) -> str:
     """Encode PIL Image to base64 JPEG, reducing quality until under max_kb."""
     if max_px:
         ratio = max_px / max(img.size)
         if ratio < 1:
+            # Thumbnails are recompressed at q<=85 anyway, so the filter
+            # barely matters there; keep LANCZOS for large, steep downscales.
+            if max_px <= 512:
+                resample = Image.Resampling.BOX
+            elif ratio < 0.5:
+                resample = Image.Resampling.LANCZOS
+            else:
+                resample = Image.Resampling.BILINEAR
+            # reducing_gap: integer box-reduce first like thumbnail() does,
+            # without mutating the caller's frame in place.
             img = img.resize(
                 (int(img.width * ratio), int(img.height * ratio)),
-                Image.LANCZOS,
+                resample,
+                reducing_gap=2.0,
             )
 
     if img.mode == "RGBA":
         img = img.convert("RGB")
 
+    encode = _jpeg_encoder(img)
+
     # Try high quality first — often fits
     max_bytes = max_kb * 1024
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG", quality=85)
-    if buf.tell() <= max_bytes:
-        return base64.b64encode(buf.getvalue()).decode()
-
-    # Binary search for the highest quality that fits
-    lo, hi = 20, 80
-    best_buf = None
+    data = encode(85)
+    if len(data) <= max_bytes:
+        return base64.b64encode(data).decode()
+
+    # JPEG size falls roughly linearly with quality in the 20-80 band, so
+    # predict the quality from the q=85 overshoot, then step down once.
+    quality = max(20, min(80, int(85 * (max_bytes / len(data)) ** 0.9)))
+    for _ in range(2):
+        data = encode(quality)
+        if len(data) <= max_bytes:
+            return base64.b64encode(data).decode()
+        if quality == 20:
+            return base64.b64encode(data).decode()  # lowest quality; send anyway
+        hi = quality - 1
+        quality = max(20, quality - 10)
+
+    # Both guesses missed: binary search below the last miss
+    lo = 20
+    best = None
     while lo <= hi:
         mid = (lo + hi) // 2
-        buf = io.BytesIO()
-        img.save(buf, format="JPEG", quality=mid)
-        if buf.tell() <= max_bytes:
-            best_buf = buf
+        data = encode(mid)
+        if len(data) <= max_bytes:
+            best = data
             lo = mid + 1
         else:
             hi = mid - 1
 
-    if best_buf is not None:
-        return base64.b64encode(best_buf.getvalue()).decode()
+    if best is not None:
+        return base64.b64encode(best).decode()
 
     # Last resort: return at lowest quality
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG", quality=20)
-    return base64.b64encode(buf.getvalue()).decode()
+    return base64.b64encode(encode(20)).decode()
 
 
 def package_full_frame(frame: Image.Image, max_px: int = 384) -> dict:
@@ -0,0 +1,105 @@
+"""Tests for ChangeDetector region/bbox computation."""
+
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from sense_client.change_detector import (
+    MAX_SCROLL_SHIFT,
+    ChangeDetector,
+    estimate_vertical_motion,
+)
+from sense_client.roi_extractor import ROIExtractor
+
+
+def _frame(arr: np.ndarray) -> Image.Image:
+    return Image.fromarray(arr)
+
+
+class TestChangeDetectorBBox(unittest.TestCase):
+    """Merged bbox must match the extent of all changed-pixel coordinates."""
+
+    def setUp(self):
+        self.det = ChangeDetector(threshold=0.99, min_area=10)
+        self.base = np.zeros((120, 160), dtype=np.uint8)
+        self.det.detect(_frame(self.base))
+
+    def test_merged_bbox_matches_coords(self):
+        changed = self.base.copy()
+        changed[10:40, 20:60] = 255
+        changed[70:90, 100:150] = 200
+        result = self.det.detect(_frame(changed))
+        self.assertIsNotNone(result)
+
+        coords = np.vstack(result.contours)
+        min_y, min_x = coords.min(axis=0)
+        max_y, max_x = coords.max(axis=0)
+        expected = (int(min_x), int(min_y), int(max_x - min_x), int(max_y - min_y))
+        self.assertEqual(result.bbox, expected)
+
+    def test_boxes_align_with_contours(self):
+        changed = self.base.copy()
+        changed[10:40, 20:60] = 255
+        changed[70:90, 100:150] = 200
+        result = self.det.detect(_frame(changed))
+        self.assertEqual(len(result.boxes), len(result.contours))
+        for coords, box in zip(result.contours, result.boxes):
+            min_y, min_x = coords.min(axis=0)
+            max_y, max_x = coords.max(axis=0)
+            self.assertEqual(box, (min_x, min_y, max_x, max_y))
+
+        extractor = ROIExtractor(padding=5, min_size=(8, 8))
+        frame = _frame(changed)
+        with_table = extractor.extract(frame, result.contours, result.boxes)
+        without = extractor.extract(frame, result.contours)
+        self.assertEqual([r.bbox for r in with_table], [r.bbox for r in without])
+
+    def test_no_change_returns_none(self):
+        self.assertIsNone(self.det.detect(_frame(self.base.copy())))
+
+
+class TestVerticalMotion(unittest.TestCase):
+    """Row-profile scroll estimate."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        page = (rng.random((350, 200)) * 255).astype(np.uint8)
+        self.page = np.repeat(page, 4, axis=0)  # 1400 rows of banded "text"
+
+    def test_detects_scroll_down(self):
+        prev = self.page[100:1000]
+        cur = self.page[160:1060]
+        self.assertEqual(estimate_vertical_motion(prev, cur), 60)
+
+    def test_detects_scroll_up(self):
+        prev = self.page[100:1000]
+        cur = self.page[40:940]
+        self.assertEqual(estimate_vertical_motion(prev, cur), -60)
+
+    def test_unrelated_frame_is_not_motion(self):
+        prev = self.page[100:1000]
+        noise = (np.random.default_rng(1).random((900, 200)) * 255).astype(np.uint8)
+        self.assertEqual(estimate_vertical_motion(prev, noise), 0)
+
+    def test_default_search_is_capped(self):
+        tall = np.repeat(self.page, 3, axis=0)  # 4200 rows
+        prev = tall[0:3000]
+        cur = tall[MAX_SCROLL_SHIFT + 40:MAX_SCROLL_SHIFT + 3040]
+        self.assertEqual(estimate_vertical_motion(prev, cur), 0)
+        self.assertEqual(estimate_vertical_motion(prev, cur, max_shift=MAX_SCROLL_SHIFT + 64),
+                         MAX_SCROLL_SHIFT + 40)
+
+    def test_detector_reuses_keyframe_profile(self):
+        det = ChangeDetector(threshold=0.99, min_area=10)
+        det.detect(_frame(self.page[100:1000]))
+        result = det.detect(_frame(self.page[160:1060]))
+        self.assertIsNotNone(result)
+        self.assertEqual(result.vertical_motion, 60)
+        # The new keyframe's cached profile is the one just computed
+        np.testing.assert_array_equal(det._prev_profile,
+                                      np.diff(self.page[160:1060].mean(axis=1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
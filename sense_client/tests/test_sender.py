@@ -0,0 +1,141 @@
+"""Tests for SenseSender payload serialization and image encoding."""
+
+import base64
+import io
+import json
+import unittest
+import zlib
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from PIL import Image
+
+from sense_client import sender as sender_mod
+from sense_client.gate import SenseEvent, SenseMeta, SenseObservation
+
+
+class TestDumps(unittest.TestCase):
+
+    PAYLOAD = {"type": "text", "ts": 1.5, "ocr": "héllo", "meta": {"ssim": np.float64(0.875)}}
+
+    def test_serializes_numpy_scalars(self):
+        data = sender_mod._dumps(self.PAYLOAD)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(json.loads(data)["meta"]["ssim"], 0.875)
+
+    def test_stdlib_fallback(self):
+        with patch.object(sender_mod, "orjson", None):
+            data = sender_mod._dumps(self.PAYLOAD)
+        self.assertEqual(json.loads(data)["ocr"], "héllo")
+
+
+class TestLatencyPercentiles(unittest.TestCase):
+
+    def test_matches_sorted_ranks(self):
+        samples = list(np.random.default_rng(0).random(1001) * 100)
+        ordered = sorted(samples)
+        self.assertEqual(sender_mod.latency_percentiles(samples), (ordered[500], ordered[950]))
+
+    def test_sender_buffer_is_bounded(self):
+        sender = sender_mod.SenseSender()
+        sender._latencies.extend(range(sender_mod.LATENCY_WINDOW + 10))
+        self.assertEqual(len(sender._latencies), sender_mod.LATENCY_WINDOW)
+
+
+class TestBuildPayload(unittest.TestCase):
+
+    def test_minimal_event(self):
+        event = SenseEvent(type="text", ts=1.0, ocr="hi",
+                           meta=SenseMeta(ssim=0.9, app="Code", window_title="a.py"))
+        self.assertEqual(sender_mod._build_payload(event), {
+            "type": "text", "ts": 1.0, "ocr": "hi",
+            "meta": {"ssim": 0.9, "app": "Code", "windowTitle": "a.py", "screen": 0},
+        })
+
+    def test_optional_sections(self):
+        event = SenseEvent(type="visual", ts=1.0, roi={"data": "x"},
+                           observation=SenseObservation(title="t", facts=["app: Code"]))
+        payload = sender_mod._build_payload(event)
+        self.assertEqual(payload["roi"], {"data": "x"})
+        self.assertNotIn("diff", payload)
+        self.assertEqual(payload["observation"]["facts"], ["app: Code"])
+
+
+class TestCompression(unittest.TestCase):
+
+    def _send(self, **kwargs):
+        sender = sender_mod.SenseSender(url="http://localhost:18791", **kwargs)
+        event = SenseEvent(type="text", ts=1.0, ocr="x" * 500)
+        with patch.object(sender._session, "post") as post:
+            post.return_value = MagicMock(status_code=200)
+            self.assertTrue(sender.send(event))
+        return post.call_args.kwargs
+
+    def test_uncompressed_by_default(self):
+        kwargs = self._send()
+        self.assertIsNone(kwargs["headers"])
+        self.assertEqual(json.loads(kwargs["data"])["ocr"], "x" * 500)
+
+    def test_deflate_body(self):
+        kwargs = self._send(compression="deflate")
+        self.assertEqual(kwargs["headers"], {"Content-Encoding": "deflate"})
+        self.assertEqual(json.loads(zlib.decompress(kwargs["data"]))["ocr"], "x" * 500)
+
+
+def _noisy_image(w: int = 640, h: int = 400) -> Image.Image:
+    """Gradient plus moderate noise: too big at q85, fits after a search."""
+    rng = np.random.default_rng(0)
+    grad = np.linspace(0, 200, w)[None, :, None].repeat(h, 0).repeat(3, 2)
+    noise = rng.normal(0, 20, (h, w, 3))
+    return Image.fromarray(np.clip(grad + noise, 0, 255).astype(np.uint8))
+
+
+def _decode(b64: str) -> Image.Image:
+    return Image.open(io.BytesIO(base64.b64decode(b64)))
+
+
+class TestEncodeImage(unittest.TestCase):
+
+    def test_fits_budget_and_decodes(self):
+        with patch.object(sender_mod, "_turbojpeg", None):
+            b64 = sender_mod.encode_image(_noisy_image(), max_kb=30)
+        self.assertLessEqual(len(base64.b64decode(b64)), 30 * 1024)
+        self.assertEqual(_decode(b64).format, "JPEG")
+
+    def test_downscales_to_max_px(self):
+        with patch.object(sender_mod, "_turbojpeg", None):
+            b64 = sender_mod.encode_image(_noisy_image(), max_kb=200, max_px=320)
+        self.assertEqual(max(_decode(b64).size), 320)
+
+    def test_predicts_quality_in_few_encodes(self):
+        qualities = []
+        real = sender_mod._jpeg_encoder
+
+        def counting(img):
+            encode = real(img)
+
+            def wrapped(quality):
+                qualities.append(quality)
+                return encode(quality)
+            return wrapped
+
+        with patch.object(sender_mod, "_turbojpeg", None), \
+                patch.object(sender_mod, "_jpeg_encoder", counting):
+            b64 = sender_mod.encode_image(_noisy_image(), max_kb=40)
+        self.assertLessEqual(len(base64.b64decode(b64)), 40 * 1024)
+        self.assertEqual(qualities[0], 85)
+        self.assertLessEqual(len(qualities), 3)
+
+    def test_uses_turbojpeg_when_available(self):
+        fake = MagicMock()
+        fake.encode.return_value = b"\xff\xd8jpeg"
+        with patch.object(sender_mod, "_turbojpeg", fake), \
+                patch.object(sender_mod, "TJPF_RGB", 0, create=True):
+            b64 = sender_mod.encode_image(_noisy_image(), max_kb=200)
+        self.assertEqual(base64.b64decode(b64), b"\xff\xd8jpeg")
+        arr = fake.encode.call_args.args[0]
+        self.assertEqual(arr.shape, (400, 640, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ parallel OCR, skip image for text events, latency instrumentation."""
 
 import time
 import unittest
+from collections import deque
 from unittest.mock import MagicMock, patch
 
 from sense_client.change_detector import ChangeDetector, ChangeResult
@@ -140,11 +141,11 @@ class TestSenderLatencyTracking(unittest.TestCase):
 
     def test_init_has_latency_fields(self):
         sender = SenseSender()
-        self.assertIsInstance(sender._latencies, list)
+        self.assertIsInstance(sender._latencies, deque)
         self.assertEqual(len(sender._latencies), 0)
         self.assertIsInstance(sender._last_stats_ts, float)
 
-    @patch("sense_client.sender.requests.post")
+    @patch("sense_client.sender.requests.Session.post")
     def test_send_tracks_latency(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -159,14 +160,14 @@ class TestSenderLatencyTracking(unittest.TestCase):
         self.assertEqual(len(sender._latencies), 1)
         self.assertGreater(sender._latencies[0], 0)
 
-    @patch("sense_client.sender.requests.post")
+    @patch("sense_client.sender.requests.Session.post")
     def test_stats_logged_after_interval(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_post.return_value = mock_resp
 
         sender = SenseSender(url="http://localhost:18791")
-        sender._last_stats_ts = time.time() - 61  # pretend 61s ago
+        sender._last_stats_ts = time.monotonic() - 61  # pretend 61s ago
 
         event = SenseEvent(type="text", ts=time.time() * 1000, ocr="test",
                            meta=SenseMeta(ssim=0.9, app="test"))
@@ -178,7 +179,7 @@ class TestSenderLatencyTracking(unittest.TestCase):
             stats_logged = any("[sender] relay latency" in c for c in calls)
             self.assertTrue(stats_logged, f"Expected latency stats log, got: {calls}")
 
-    @patch("sense_client.sender.requests.post")
+    @patch("sense_client.sender.requests.Session.post")
     def test_stats_not_logged_before_interval(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
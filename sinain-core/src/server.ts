@@ -1,4 +1,5 @@
 import { createServer, type IncomingMessage, type ServerResponse } from "node:http";
+import { inflateSync } from "node:zlib";
 import { WebSocketServer, WebSocket } from "ws";
 import type { CoreConfig, SenseEvent } from "./types.js";
 import type { Profiler } from "./profiler.js";
@@ -34,9 +35,14 @@ export interface ServerDeps {
   feedbackStore?: FeedbackStore;
 }
 
+/**
+ * Read a request body up to maxBytes (on the wire). Bodies sent with
+ * `Content-Encoding: deflate` (sense_client relay.compression) are inflated,
+ * with the same limit applied to the inflated size.
+ */
 function readBody(req: IncomingMessage, maxBytes: number): Promise<string> {
   return new Promise((resolve, reject) => {
-    let body = "";
+    const chunks: Buffer[] = [];
     let bytes = 0;
     req.on("data", (chunk: Buffer) => {
       bytes += chunk.length;
@@ -45,9 +51,20 @@ function readBody(req: IncomingMessage, maxBytes: number): Promise<string> {
         req.destroy();
         return;
       }
-      body += chunk;
+      chunks.push(chunk);
+    });
+    req.on("end", () => {
+      const raw = Buffer.concat(chunks);
+      if (req.headers["content-encoding"] !== "deflate") {
+        resolve(raw.toString());
+        return;
+      }
+      try {
+        resolve(inflateSync(raw, { maxOutputLength: maxBytes }).toString());
+      } catch (err: any) {
+        reject(new Error(err?.code === "ERR_BUFFER_TOO_LARGE" ? "body too large" : "invalid deflate body"));
+      }
     });
-    req.on("end", () => resolve(body));
     req.on("error", reject);
   });
 }
@@ -62,7 +79,7 @@ export function createAppServer(deps: ServerDeps) {
 
     if (req.method === "OPTIONS") {
       res.setHeader("Access-Control-Allow-Methods", "GET, POST, OPTIONS");
-      res.setHeader("Access-Control-Allow-Headers", "Content-Type");
+      res.setHeader("Access-Control-Allow-Headers", "Content-Type, Content-Encoding");
       res.writeHead(204);
       res.end();
       return;
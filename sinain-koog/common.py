@@ -3,22 +3,56 @@
 Centralizes OpenRouter API calls, memory/ file readers, and JSON output.
 """
 
+import heapq
 import json
 import os
 import re
 import sys
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, time as dt_time, timedelta, timezone
 from functools import lru_cache
 from glob import glob
 from pathlib import Path
+from typing import Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses several times faster than the stdlib when installed
+_loads = orjson.loads if orjson is not None else json.loads
 
 MODEL_FAST = "google/gemini-3-flash-preview"
 MODEL_SMART = "anthropic/claude-sonnet-4.6"
 OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 
+# Shared keep-alive session: scripts that call the LLM more than once (retries,
+# per-item judging) reuse the TLS connection instead of re-handshaking.
+# Transient gateway/rate-limit statuses and connect failures are retried at the
+# transport with a short fixed backoff (0.3s, 0.6s). Retry-After is ignored: an
+# uncapped server-chosen wait could stall a short CLI run far past its request
+# timeout. Read timeouts are not retried: a completion that times out would
+# just time out again, and call_llm_with_fallback owns that policy.
+_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    status=2,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY))
+
 
 class LLMError(Exception):
     """Raised when the LLM API call fails (timeout, network, bad response)."""
@@ -29,6 +63,12 @@ class LLMError(Exception):
 # Robust JSON extraction from LLM responses
 # ---------------------------------------------------------------------------
 
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+_TRAILING_TOKENS_RE = re.compile(r"[,:\s]+$")
+_JSON_STRUCTURAL_RE = re.compile(r'[{}\[\]"]')
+_JSON_IN_STRING_RE = re.compile(r'["\\]')
+
+
 def extract_json(text: str) -> dict | list:
     """Extract a JSON object or array from potentially messy LLM output.
 
@@ -41,14 +81,15 @@ def extract_json(text: str) -> dict | list:
     """
     text = text.strip()
 
-    # Stage 1: direct parse
+    # Stage 1: direct parse (orjson when available; the tolerant stdlib
+    # stages below still handle anything it rejects, e.g. NaN literals)
     try:
-        return json.loads(text)
+        return _loads(text)
     except json.JSONDecodeError:
         pass
 
     # Stage 2: markdown code fences  ```json ... ```  or  ``` ... ```
-    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)```", text, re.DOTALL)
+    fence_match = _FENCE_RE.search(text)
     if fence_match:
         try:
             return json.loads(fence_match.group(1).strip())
@@ -63,64 +104,69 @@ def extract_json(text: str) -> dict | list:
             continue
         stack: list[str] = []
         in_string = False
-        escape = False
         string_start = -1
-        for i in range(start, len(text)):
-            ch = text[i]
-            if escape:
-                escape = False
-                continue
+        malformed = False
+        # Jump between structural chars at C speed: brackets and quotes outside
+        # strings, only quotes and backslashes inside them.
+        pos = start
+        while True:
+            m = (_JSON_IN_STRING_RE if in_string else _JSON_STRUCTURAL_RE).search(text, pos)
+            if m is None:
+                break
+            i = m.start()
+            ch = m.group()
+            pos = i + 1
             if ch == "\\":
-                if in_string:
-                    escape = True
+                pos += 1  # skip the escaped char
                 continue
             if ch == '"':
                 if not in_string:
                     string_start = i
                 in_string = not in_string
                 continue
-            if in_string:
-                continue
             if ch in ("{", "["):
                 stack.append("}" if ch == "{" else "]")
-            elif ch in ("}", "]"):
+            else:
                 if stack:
                     stack.pop()
                 if not stack:
                     try:
                         return json.loads(text[start : i + 1])
                     except json.JSONDecodeError:
-                        break  # malformed — try next bracket type
-        else:
-            # Reached end of text with unclosed brackets — attempt repair
-            if not stack:
-                continue
-            closers = "".join(reversed(stack))
-            fragment = text[start:]
+                        malformed = True  # try next bracket type
+                        break
+        if malformed:
+            continue
 
-            # Strategy A: if mid-string, close it then close all brackets
-            if in_string:
-                try:
-                    return json.loads(fragment + '"' + closers)
-                except json.JSONDecodeError:
-                    pass
+        # Reached end of text with unclosed brackets — attempt repair
+        if not stack:
+            continue
+        closers = "".join(reversed(stack))
+        fragment = text[start:]
 
-            # Strategy B: strip trailing incomplete tokens, close brackets
-            stripped = re.sub(r'[,:\s]+$', '', fragment)
+        # Strategy A: if mid-string, close it then close all brackets
+        if in_string:
             try:
-                return json.loads(stripped + closers)
+                return json.loads(fragment + '"' + closers)
             except json.JSONDecodeError:
                 pass
 
-            # Strategy C: if mid-string, cut before the unclosed string,
-            # strip trailing tokens, close brackets
-            if in_string and string_start >= start:
-                before_str = text[start:string_start]
-                before_str = re.sub(r'[,:\s]+$', '', before_str)
-                try:
-                    return json.loads(before_str + closers)
-                except json.JSONDecodeError:
-                    pass
+        # Strategy B: strip trailing incomplete tokens, close brackets
+        stripped = _TRAILING_TOKENS_RE.sub("", fragment)
+        try:
+            return json.loads(stripped + closers)
+        except json.JSONDecodeError:
+            pass
+
+        # Strategy C: if mid-string, cut before the unclosed string,
+        # strip trailing tokens, close brackets
+        if in_string and string_start >= start:
+            before_str = text[start:string_start]
+            before_str = _TRAILING_TOKENS_RE.sub("", before_str)
+            try:
+                return json.loads(before_str + closers)
+            except json.JSONDecodeError:
+                pass
 
     raise ValueError(f"No valid JSON found in LLM response ({len(text)} chars): {text[:120]}...")
 
@@ -134,7 +180,7 @@ def _load_config() -> dict:
     """Load koog-config.json from the same directory as this module. Cached."""
     config_path = Path(__file__).resolve().parent / "koog-config.json"
     try:
-        return json.loads(config_path.read_text(encoding="utf-8"))
+        return _loads(config_path.read_bytes())
     except (FileNotFoundError, json.JSONDecodeError) as exc:
         print(f"[warn] koog-config.json not loaded: {exc}", file=sys.stderr)
         return {}
@@ -147,63 +193,77 @@ def _resolve_model(logical_name: str) -> str:
     return models.get(logical_name, logical_name)
 
 
-def call_llm(
-    system_prompt: str,
-    user_prompt: str,
-    model: str = MODEL_FAST,
-    max_tokens: int = 1500,
-    *,
-    script: str | None = None,
-    json_mode: bool = False,
-) -> str:
-    """Call OpenRouter chat completions API. Returns assistant message text.
-
-    When *script* is provided, model and max_tokens are overridden from
-    koog-config.json (external config the bot cannot modify).
+@lru_cache(maxsize=1)
+def _script_table() -> dict[str | None, tuple[str, int | None, int, bool]]:
+    """Flatten per-script config into ``{script: (model, max_tokens, timeout, cache)}``.
 
-    When *json_mode* is True and the resolved model starts with ``openai/``,
-    ``response_format: {"type": "json_object"}`` is added to the request body.
+    Model names are resolved once here so call_llm does a single dict lookup.
+    The ``None`` key holds the defaults used for unlisted scripts; a
+    max_tokens of None means "keep the caller's value".
     """
+    cfg = _load_config()
+    defaults = cfg.get("defaults", {})
+    default_timeout = defaults.get("timeout", 60)
+
+    def _entry(script_cfg: dict) -> tuple[str, int | None, int, bool]:
+        return (
+            _resolve_model(script_cfg.get("model", "fast")),
+            script_cfg.get("maxTokens"),
+            script_cfg.get("timeout", default_timeout),
+            bool(script_cfg.get("cacheSystemPrompt", False)),
+        )
+
+    table: dict[str | None, tuple[str, int | None, int, bool]] = {
+        name: _entry(script_cfg) for name, script_cfg in cfg.get("scripts", {}).items()
+    }
+    table[None] = _entry(defaults)
+    return table
+
+
+def _chat_request(
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    max_tokens: int,
+    script: str | None,
+    json_mode: bool,
+) -> tuple[str, dict, dict, int]:
+    """Resolve config and build ``(model, headers, body, timeout_s)`` for a chat call."""
     timeout_s = 60
+    cache_system = False
     if script:
-        cfg = _load_config()
-        script_cfg = cfg.get("scripts", {}).get(script, cfg.get("defaults", {}))
-        model = _resolve_model(script_cfg.get("model", "fast"))
-        max_tokens = script_cfg.get("maxTokens", max_tokens)
-        timeout_s = script_cfg.get("timeout", cfg.get("defaults", {}).get("timeout", 60))
+        table = _script_table()
+        model, script_max_tokens, timeout_s, cache_system = table.get(script) or table[None]
+        if script_max_tokens is not None:
+            max_tokens = script_max_tokens
 
     api_key = os.environ.get("OPENROUTER_API_KEY") or os.environ.get("OPENROUTER_API_KEY_REFLECTION")
     if not api_key:
         raise RuntimeError("OPENROUTER_API_KEY or OPENROUTER_API_KEY_REFLECTION env var is not set")
 
+    system_content: str | list = system_prompt
+    if cache_system and model.startswith("anthropic/"):
+        # Anthropic only caches on an explicit breakpoint; OpenAI-style
+        # providers cache stable prefixes automatically.
+        system_content = [
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}},
+        ]
+
     body: dict = {
         "model": model,
         "max_tokens": max_tokens,
         "messages": [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": system_content},
             {"role": "user", "content": user_prompt},
         ],
     }
     if json_mode and model.startswith("openai/"):
         body["response_format"] = {"type": "json_object"}
+    return model, {"Authorization": f"Bearer {api_key}"}, body, timeout_s
 
-    try:
-        resp = requests.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json=body,
-            timeout=timeout_s,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.exceptions.RequestException as e:
-        raise LLMError(f"LLM call failed ({type(e).__name__}): {e}") from e
 
-    # Log token usage to stderr for cost tracking
-    usage = data.get("usage", {})
+def _log_usage(model: str, usage: dict) -> None:
+    """Log token usage to stderr for cost tracking."""
     if usage:
         print(
             f"[tokens] model={model} prompt={usage.get('prompt_tokens', '?')} "
@@ -212,12 +272,110 @@ def call_llm(
             file=sys.stderr,
         )
 
+
+def call_llm(
+    system_prompt: str,
+    user_prompt: str,
+    model: str = MODEL_FAST,
+    max_tokens: int = 1500,
+    *,
+    script: str | None = None,
+    json_mode: bool = False,
+    stream: bool = False,
+) -> str:
+    """Call OpenRouter chat completions API. Returns assistant message text.
+
+    When *script* is provided, model and max_tokens are overridden from
+    koog-config.json (external config the bot cannot modify).
+
+    When *json_mode* is True and the resolved model starts with ``openai/``,
+    ``response_format: {"type": "json_object"}`` is added to the request body.
+
+    Scripts with ``"cacheSystemPrompt": true`` in koog-config.json send the
+    system prompt as a cacheable block on ``anthropic/`` models.
+
+    With *stream* the response is consumed as SSE deltas via call_llm_stream
+    and joined; the timeout then bounds each read, not the whole completion.
+    """
+    if stream:
+        return "".join(call_llm_stream(
+            system_prompt, user_prompt, model, max_tokens,
+            script=script, json_mode=json_mode,
+        ))
+
+    model, headers, body, timeout_s = _chat_request(
+        system_prompt, user_prompt, model, max_tokens, script, json_mode,
+    )
+
+    try:
+        resp = _SESSION.post(OPENROUTER_URL, headers=headers, json=body, timeout=timeout_s)
+        resp.raise_for_status()
+        data = resp.json()
+    except requests.exceptions.RequestException as e:
+        raise LLMError(f"LLM call failed ({type(e).__name__}): {e}") from e
+
+    _log_usage(model, data.get("usage", {}))
+
     content = data["choices"][0]["message"]["content"]
     if not content:
         raise LLMError(f"LLM returned empty response (model={model})")
     return content
 
 
+def call_llm_stream(
+    system_prompt: str,
+    user_prompt: str,
+    model: str = MODEL_FAST,
+    max_tokens: int = 1500,
+    *,
+    script: str | None = None,
+    json_mode: bool = False,
+) -> Iterator[str]:
+    """Streaming variant of call_llm: yields content deltas as SSE chunks arrive.
+
+    Same config resolution and error contract as call_llm (LLMError on
+    transport failure or an empty completion). The configured timeout bounds
+    each read and, as a wall-clock deadline, the whole response, so a server
+    trickling keep-alives or slow deltas cannot hold the call open forever.
+    """
+    model, headers, body, timeout_s = _chat_request(
+        system_prompt, user_prompt, model, max_tokens, script, json_mode,
+    )
+    body["stream"] = True
+
+    produced = False
+    deadline = time.monotonic() + timeout_s
+    try:
+        with _SESSION.post(OPENROUTER_URL, headers=headers, json=body,
+                           timeout=timeout_s, stream=True) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if time.monotonic() > deadline:
+                    raise LLMError(f"LLM stream exceeded {timeout_s}s (model={model})")
+                # SSE: "data: {...}" frames; ":" lines are keep-alive comments
+                if not line.startswith(b"data:"):
+                    continue
+                payload = line[5:].strip()
+                if payload == b"[DONE]":
+                    break
+                try:
+                    chunk = _loads(payload)
+                except json.JSONDecodeError:
+                    continue
+                if chunk.get("usage"):
+                    _log_usage(model, chunk["usage"])
+                for choice in chunk.get("choices", []):
+                    delta = (choice.get("delta") or {}).get("content")
+                    if delta:
+                        produced = True
+                        yield delta
+    except requests.exceptions.RequestException as e:
+        raise LLMError(f"LLM call failed ({type(e).__name__}): {e}") from e
+
+    if not produced:
+        raise LLMError(f"LLM returned empty response (model={model})")
+
+
 def call_llm_with_fallback(
     system_prompt: str,
     user_prompt: str,
@@ -251,6 +409,13 @@ def call_llm_with_fallback(
 # Memory file readers
 # ---------------------------------------------------------------------------
 
+# Playbook metadata comments, compiled once (parsers run per playbook read)
+_MODULE_STACK_RE = re.compile(r"<!--\s*module-stack:\s*([^>]+?)\s*-->")
+_MODULE_PRIORITY_RE = re.compile(r"^(.+?)\((\d+)\)$")
+_MINING_RE = re.compile(r"<!--\s*mining-index:\s*([^>]+?)\s*-->")
+_EFFECTIVENESS_RE = re.compile(r"<!--\s*effectiveness:\s*([^>]+?)\s*-->")
+_LOG_FILE_RE = re.compile(r"\d{4}-\d{2}-\d{2}\.jsonl")
+
 def read_playbook(memory_dir: str) -> str:
     """Read sinain-playbook.md, return empty string if missing."""
     p = Path(memory_dir) / "sinain-playbook.md"
@@ -277,7 +442,7 @@ def parse_module_stack(playbook_text: str) -> list[dict]:
     Returns a list of ``{"id": str, "priority": int}`` dicts sorted by priority
     descending (highest first), or an empty list if the comment is absent.
     """
-    m = re.search(r"<!--\s*module-stack:\s*([^>]+?)\s*-->", playbook_text)
+    m = _MODULE_STACK_RE.search(playbook_text)
     if not m:
         return []
     raw = m.group(1)
@@ -287,7 +452,7 @@ def parse_module_stack(playbook_text: str) -> list[dict]:
         if not token:
             continue
         # Parse "module-id(priority)" format
-        paren = re.match(r"^(.+?)\((\d+)\)$", token)
+        paren = _MODULE_PRIORITY_RE.match(token)
         if paren:
             stack.append({"id": paren.group(1).strip(), "priority": int(paren.group(2))})
         else:
@@ -301,41 +466,65 @@ def _read_jsonl(path: Path) -> list[dict]:
     if not path.exists():
         return []
     entries = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entries.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
+    # Iterate the buffered file instead of read_text().splitlines(), which
+    # holds the whole log twice in memory. Lines stay bytes: both orjson and
+    # json.loads take UTF-8 bytes, which skips a str decode per line.
+    with path.open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(_loads(line))
+            except json.JSONDecodeError:  # orjson's error subclasses this
+                continue
     return entries
 
 
+def _log_ts(entry: dict) -> str:
+    return entry.get("ts", "")
+
+
+def _is_calendar_day(day: str) -> bool:
+    try:
+        datetime.strptime(day, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
 def read_recent_logs(memory_dir: str, days: int = 7) -> list[dict]:
     """Read playbook-logs from the last N days, newest first."""
     log_dir = Path(memory_dir) / "playbook-logs"
     if not log_dir.is_dir():
         return []
 
+    # YYYY-MM-DD names sort chronologically, so the day cutoff is a plain
+    # string compare: keep days whose midnight is not before now - days.
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    entries: list[dict] = []
-
-    for jsonl_file in sorted(log_dir.glob("*.jsonl"), reverse=True):
-        # Filename is YYYY-MM-DD.jsonl
-        try:
-            file_date = datetime.strptime(jsonl_file.stem, "%Y-%m-%d").replace(
-                tzinfo=timezone.utc
-            )
-        except ValueError:
-            continue
-        if file_date < cutoff:
-            break
-        entries.extend(_read_jsonl(jsonl_file))
-
-    # Sort by timestamp descending
-    entries.sort(key=lambda e: e.get("ts", ""), reverse=True)
-    return entries
+    first_day = cutoff.date()
+    if cutoff.time() != dt_time(0):
+        first_day += timedelta(days=1)
+    first_day_str = first_day.isoformat()
+
+    with os.scandir(log_dir) as it:
+        names = [
+            e.name for e in it
+            if _LOG_FILE_RE.fullmatch(e.name) and e.name[:10] >= first_day_str
+        ]
+    # The regex is only a shape check; drop impossible dates (2026-13-45)
+    names = [name for name in names if _is_calendar_day(name[:10])]
+    names.sort(reverse=True)
+
+    per_file: list[list[dict]] = []
+    for name in names:
+        day = _read_jsonl(log_dir / name)
+        day.sort(key=_log_ts, reverse=True)  # appended in order: near-linear
+        per_file.append(day)
+
+    # Merge the per-day runs (timestamp descending) instead of re-sorting
+    # the concatenation; ties keep newest-file-first order as before.
+    return list(heapq.merge(*per_file, key=_log_ts, reverse=True))
 
 
 def read_today_log(memory_dir: str) -> list[dict]:
@@ -354,7 +543,7 @@ def list_daily_memory_files(memory_dir: str) -> list[str]:
 
 def parse_mining_index(playbook_text: str) -> list[str]:
     """Extract mined dates from <!-- mining-index: ... --> comment."""
-    m = re.search(r"<!--\s*mining-index:\s*([^>]+?)\s*-->", playbook_text)
+    m = _MINING_RE.search(playbook_text)
     if not m:
         return []
     return [d.strip() for d in m.group(1).split(",") if d.strip()]
@@ -365,16 +554,15 @@ def parse_effectiveness(playbook_text: str) -> dict | None:
 
     Returns dict with keys: outputs, positive, negative, neutral, rate, updated.
     """
-    m = re.search(r"<!--\s*effectiveness:\s*([^>]+?)\s*-->", playbook_text)
+    m = _EFFECTIVENESS_RE.search(playbook_text)
     if not m:
         return None
     raw = m.group(1)
     result = {}
     for pair in raw.split(","):
-        pair = pair.strip()
-        if "=" not in pair:
+        key, sep, val = pair.partition("=")
+        if not sep:
             continue
-        key, val = pair.split("=", 1)
         key = key.strip()
         val = val.strip()
         # Try numeric conversion
@@ -388,10 +576,22 @@ def parse_effectiveness(playbook_text: str) -> dict | None:
     return result if result else None
 
 
-def read_file_safe(path: str) -> str:
-    """Read a file, return empty string if missing."""
+def read_file_safe(path: str, max_chars: int | None = None) -> str:
+    """Read a file, return empty string if missing.
+
+    With max_chars, only the head of the file is read and decoded; longer
+    files are cut at max_chars and marked with a trailing "... [truncated]".
+    """
     p = Path(path)
-    return p.read_text(encoding="utf-8") if p.exists() else ""
+    if not p.exists():
+        return ""
+    if max_chars is None:
+        return p.read_text(encoding="utf-8")
+    with p.open(encoding="utf-8") as f:
+        text = f.read(max_chars + 1)
+    if len(text) > max_chars:
+        return text[:max_chars] + "\n... [truncated]"
+    return text
 
 
 # ---------------------------------------------------------------------------
@@ -400,4 +600,16 @@ def read_file_safe(path: str) -> str:
 
 def output_json(data: dict) -> None:
     """Print compact JSON to stdout (for main agent to capture)."""
-    print(json.dumps(data, ensure_ascii=False))
+    if orjson is None:
+        print(json.dumps(data, ensure_ascii=False))
+        return
+    payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Replaced text stdout (StringIO, redirect_stdout): no byte layer
+        print(payload.decode())
+        return
+    # Flush pending text first so the raw bytes land after earlier prints
+    sys.stdout.flush()
+    buffer.write(payload + b"\n")
+    buffer.flush()
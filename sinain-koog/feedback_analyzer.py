@@ -13,6 +13,9 @@ Usage:
 import argparse
 import json
 import sys
+from typing import NamedTuple
+
+import numpy as np
 
 from common import (
     output_json,
@@ -20,7 +23,36 @@ from common import (
 )
 
 
-def compute_effectiveness(logs: list[dict]) -> dict:
+class LogColumns(NamedTuple):
+    """Column view of playbook-log entries, oldest first.
+
+    Only the fields the mechanical metrics read are projected out, so each
+    metric walks flat arrays instead of re-chasing nested dict lookups.
+    """
+    skipped: np.ndarray  # bool; entries without "skipped" count as skipped
+    avg: np.ndarray      # float64 feedbackScores.avg, NaN where absent
+
+
+def log_columns(logs: list[dict]) -> LogColumns:
+    """Sort entries by timestamp and project them into a LogColumns in one pass."""
+    ordered = sorted(logs, key=lambda e: e.get("ts", ""))
+    n = len(ordered)
+    skipped = np.ones(n, dtype=bool)
+    avg = np.full(n, np.nan)
+    for i, entry in enumerate(ordered):
+        skipped[i] = bool(entry.get("skipped", True))
+        score = (entry.get("feedbackScores") or {}).get("avg")
+        if score is not None:
+            avg[i] = score
+    return LogColumns(skipped, avg)
+
+
+def _as_columns(logs: list[dict] | LogColumns) -> LogColumns:
+    """Accept either raw entries or columns already built (and sorted) by the caller."""
+    return logs if isinstance(logs, LogColumns) else log_columns(logs)
+
+
+def compute_effectiveness(logs: list[dict] | LogColumns) -> dict:
     """Mechanically compute effectiveness from playbook-log entries.
 
     - outputs: ticks where Step 5 produced output (not skipped)
@@ -29,35 +61,19 @@ def compute_effectiveness(logs: list[dict]) -> dict:
     - neutral: remainder
     - rate: positive / outputs
     """
-    output_ticks = [e for e in logs if not e.get("skipped", True)]
-    outputs = len(output_ticks)
+    cols = _as_columns(logs)
+    outputs = int(np.count_nonzero(~cols.skipped))
 
     if outputs == 0:
         return {"outputs": 0, "positive": 0, "negative": 0, "neutral": 0, "rate": 0.0}
 
-    positive = 0
-    negative = 0
-    neutral = 0
-
-    # Sort by timestamp for sequential analysis
-    sorted_logs = sorted(logs, key=lambda e: e.get("ts", ""))
-
-    for i, entry in enumerate(sorted_logs):
-        if entry.get("skipped", True):
-            continue
-        # Look at next tick's feedback
-        if i + 1 < len(sorted_logs):
-            next_entry = sorted_logs[i + 1]
-            feedback = next_entry.get("feedbackScores", {})
-            avg = feedback.get("avg", 0)
-            if avg > 0.2:
-                positive += 1
-            elif avg < -0.1:
-                negative += 1
-            else:
-                neutral += 1
-        else:
-            neutral += 1  # No next tick yet
+    # Score each output by the next tick's avg. The final tick has no
+    # successor yet; a missing avg is NaN. Both compare false -> neutral.
+    out_idx = np.flatnonzero(~cols.skipped)
+    next_avg = np.append(cols.avg, np.nan)[out_idx + 1]
+    positive = int(np.count_nonzero(next_avg > 0.2))
+    negative = int(np.count_nonzero(next_avg < -0.1))
+    neutral = outputs - positive - negative
 
     rate = positive / outputs if outputs > 0 else 0.0
     return {
@@ -69,6 +85,18 @@ def compute_effectiveness(logs: list[dict]) -> dict:
     }
 
 
+TOP_PATTERNS = 5  # high/low patterns reported by extract_feedback_scores
+
+
+def _collect_distinct(acc: list, items: list) -> None:
+    """Append unseen *items* to *acc* in order until it holds TOP_PATTERNS."""
+    for item in items:
+        if item not in acc:
+            acc.append(item)
+            if len(acc) >= TOP_PATTERNS:
+                return
+
+
 def extract_feedback_scores(logs: list[dict]) -> dict:
     """Extract composite scores with time-decay weighting."""
     all_scores = []
@@ -83,12 +111,12 @@ def extract_feedback_scores(logs: list[dict]) -> dict:
             weight = max(0.3, 1.0 - (i / max(len(logs), 1)) * 0.7)
             all_scores.append((avg, weight))
 
-        for h in feedback.get("high", []):
-            if h not in high_patterns:  # deduplicate
-                high_patterns.append(h)
-        for lo in feedback.get("low", []):
-            if lo not in low_patterns:  # deduplicate
-                low_patterns.append(lo)
+        # Keep the first TOP_PATTERNS distinct patterns (newest first) and
+        # stop collecting once full; the score loop still needs every entry.
+        if len(high_patterns) < TOP_PATTERNS:
+            _collect_distinct(high_patterns, feedback.get("high", []))
+        if len(low_patterns) < TOP_PATTERNS:
+            _collect_distinct(low_patterns, feedback.get("low", []))
 
     if all_scores:
         weighted_sum = sum(s * w for s, w in all_scores)
@@ -99,8 +127,8 @@ def extract_feedback_scores(logs: list[dict]) -> dict:
 
     return {
         "avg": avg_score,
-        "high": high_patterns[:5],
-        "low": low_patterns[:5],
+        "high": high_patterns,
+        "low": low_patterns,
     }
 
 
@@ -116,20 +144,16 @@ def determine_directive(effectiveness: dict) -> str:
     return "normal"
 
 
-def compute_score_trend(logs: list[dict]) -> str:
+def compute_score_trend(logs: list[dict] | LogColumns) -> str:
     """Detect score trend from recent logs: rising, falling, or flat."""
-    scores = []
-    for entry in sorted(logs, key=lambda e: e.get("ts", "")):
-        fb = entry.get("feedbackScores", {})
-        avg = fb.get("avg")
-        if avg is not None:
-            scores.append(avg)
+    avg = _as_columns(logs).avg
+    scores = avg[~np.isnan(avg)]
     if len(scores) < 3:
         return "insufficient"
     # Compare first third vs last third
     third = max(1, len(scores) // 3)
-    early_avg = sum(scores[:third]) / third
-    late_avg = sum(scores[-third:]) / third
+    early_avg = float(scores[:third].mean())
+    late_avg = float(scores[-third:].mean())
     delta = late_avg - early_avg
     if delta > 0.1:
         return "rising"
@@ -139,7 +163,8 @@ def compute_score_trend(logs: list[dict]) -> str:
 
 
 def generate_interpretation(
-    feedback_scores: dict, effectiveness: dict, directive: str, logs: list[dict]
+    feedback_scores: dict, effectiveness: dict, directive: str,
+    logs: list[dict] | LogColumns,
 ) -> str:
     """Heuristic interpretation from mechanical metrics — no LLM needed.
 
@@ -197,15 +222,17 @@ def main():
 
     logs = read_recent_logs(args.memory_dir, days=7)
 
-    # Fully mechanical computation — no LLM call
-    effectiveness = compute_effectiveness(logs)
+    # Fully mechanical computation — no LLM call. The ts sort happens once,
+    # in log_columns; the order-sensitive metrics share the result.
+    cols = log_columns(logs)
+    effectiveness = compute_effectiveness(cols)
     feedback_scores = extract_feedback_scores(logs)
     directive = determine_directive(effectiveness)
-    interpretation = generate_interpretation(feedback_scores, effectiveness, directive, logs)
+    interpretation = generate_interpretation(feedback_scores, effectiveness, directive, cols)
 
     # Compute skip rate for proactivity tracking
     total_ticks = len(logs)
-    skip_ticks = sum(1 for e in logs if e.get("skipped", True))
+    skip_ticks = int(np.count_nonzero(cols.skipped))
     skip_rate = round(skip_ticks / total_ticks, 2) if total_ticks > 0 else 1.0
 
     output_json({
@@ -12,17 +12,26 @@ Usage:
 
 import argparse
 import json
+import re
 import sys
+from contextlib import closing
 
 from common import (
     LLMError,
-    call_llm,
+    call_llm_stream,
     extract_json,
     output_json,
     read_effective_playbook,
     read_recent_logs,
 )
 
+MAX_OUTPUT_CHARS = 500  # suggestion + insight budget for the Telegram message
+
+_SUGGESTION_START_RE = re.compile(r'"suggestion"\s*:\s*"')
+_PLAIN_RUN_RE = re.compile(r'[^"\\]+')
+_KEY_OVERLAP = 64  # chars re-searched so a key split across deltas is still found
+_HIGH_SURROGATES = ("d8", "d9", "da", "db")
+
 SYSTEM_PROMPT = """\
 You are the insight synthesizer for sinain, a personal AI assistant.
 Your job: produce ONE high-quality Telegram message with two parts.
@@ -78,6 +87,11 @@ def build_user_prompt(
 ) -> str:
     parts = []
 
+    # Playbook first: it changes far less often than the per-tick sections,
+    # so system prompt + playbook form a stable prefix providers can cache.
+    if playbook:
+        parts.append(f"## Current Playbook (post-curation)\n{playbook}\n")
+
     if current_time:
         parts.append(f"## Current Time\n{current_time}")
 
@@ -86,18 +100,20 @@ def build_user_prompt(
     if idle:
         parts.append("\n## Status: IDLE — focus on mined patterns and playbook evolution")
 
-    if playbook:
-        parts.append(f"\n## Current Playbook (post-curation)\n{playbook}")
-
     if curator_changes:
         parts.append(f"\n## Curator Changes This Tick\n{curator_changes}")
 
-    # Recent outputs to avoid repetition
+    # Recent outputs to avoid repetition, and recent skips to enforce
+    # proactivity: one pass, with each entry's skipped flag read once
     if recent_logs:
         recent_outputs = []
+        recent_skips = 0
         for entry in recent_logs[:5]:
+            if entry.get("skipped", True):
+                recent_skips += 1
+                continue
             output = entry.get("output", {})
-            if output and not entry.get("skipped", True):
+            if output:
                 recent_outputs.append({
                     "ts": entry.get("ts", "?"),
                     "suggestion": output.get("suggestion", "")[:100],
@@ -105,16 +121,74 @@ def build_user_prompt(
                 })
         if recent_outputs:
             parts.append(f"\n## Recent Outputs (DO NOT REPEAT)\n{json.dumps(recent_outputs, indent=2)}")
-
-    # Count recent skips to enforce proactivity
-    if recent_logs:
-        recent_skips = sum(1 for e in recent_logs[:5] if e.get("skipped", True))
         if recent_skips >= 3:
             parts.append(f"\n## PROACTIVITY OVERRIDE: {recent_skips} of last 5 outputs were skipped. You MUST produce output this tick.")
 
     return "\n".join(parts)
 
 
+class SuggestionBudget:
+    """Incremental check that a streaming suggestion exceeds MAX_OUTPUT_CHARS.
+
+    The insight can be trimmed to fit the budget, but a suggestion that alone
+    is over it always ends in a skip, so generation can stop early. Each
+    feed() scans only the text added since the last call, counting decoded
+    characters; an escape split across deltas waits for its remainder.
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._pos = 0        # next index to scan (key search or string body)
+        self._in_value = False
+        self._closed = False
+        self._chars = 0
+
+    def feed(self, delta: str) -> bool:
+        """Append a stream delta; True once the suggestion is over budget."""
+        self._buf += delta
+        if not self._in_value:
+            m = _SUGGESTION_START_RE.search(self._buf, self._pos)
+            if not m:
+                self._pos = max(0, len(self._buf) - _KEY_OVERLAP)
+                return False
+            self._in_value = True
+            self._pos = m.end()
+        if not self._closed:
+            self._scan()
+        return self._chars > MAX_OUTPUT_CHARS
+
+    def _scan(self) -> None:
+        buf, pos, end = self._buf, self._pos, len(self._buf)
+        while pos < end:
+            run = _PLAIN_RUN_RE.match(buf, pos)
+            if run:
+                self._chars += run.end() - pos
+                pos = run.end()
+                continue
+            if buf[pos] == '"':
+                self._closed = True
+                break
+            width = 2
+            if buf.startswith("\\u", pos):
+                width = 6
+                # A high surrogate and the \uXXXX after it decode to one char
+                if buf[pos + 2:pos + 4].lower() in _HIGH_SURROGATES:
+                    if pos + 8 > end:
+                        break
+                    if buf.startswith("\\u", pos + 6):
+                        width = 12
+            if pos + width > end:
+                break
+            self._chars += 1
+            pos += width
+        self._pos = pos
+
+
+def suggestion_overflows(partial: str) -> bool:
+    """True once a (possibly still streaming) suggestion exceeds MAX_OUTPUT_CHARS."""
+    return SuggestionBudget().feed(partial)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Phase 3: Insight synthesis")
     parser.add_argument("--memory-dir", required=True, help="Path to memory/ directory")
@@ -136,9 +210,26 @@ def main():
         current_time=args.current_time,
     )
 
+    # Stream so decoding stops as soon as the output is certain to be skipped
+    raw = ""
+    budget = SuggestionBudget()
+    aborted = False
     try:
-        raw = call_llm(SYSTEM_PROMPT, user_prompt, script="insight_synthesizer", json_mode=True)
-        result = extract_json(raw)
+        stream = call_llm_stream(SYSTEM_PROMPT, user_prompt, script="insight_synthesizer",
+                                 json_mode=True)
+        with closing(stream):
+            for delta in stream:
+                raw += delta
+                if budget.feed(delta):
+                    aborted = True
+                    break
+        if aborted:
+            result = {
+                "skip": True,
+                "skipReason": f"Suggestion exceeded {MAX_OUTPUT_CHARS} chars (generation stopped early)",
+            }
+        else:
+            result = extract_json(raw)
     except (ValueError, LLMError) as e:
         print(f"[warn] {e}", file=sys.stderr)
         result = {
@@ -152,9 +243,9 @@ def main():
         insight = result.get("insight", "")
         total_chars = len(suggestion) + len(insight)
 
-        if total_chars > 500:
+        if total_chars > MAX_OUTPUT_CHARS:
             # Truncate insight to fit
-            max_insight = 500 - len(suggestion) - 10  # buffer
+            max_insight = MAX_OUTPUT_CHARS - len(suggestion) - 10  # buffer
             if max_insight > 50:
                 truncated = insight[:max_insight]
                 # Cut at last sentence boundary
@@ -170,7 +261,7 @@ def main():
                 total_chars = len(suggestion) + len(insight)
             else:
                 result["skip"] = True
-                result["skipReason"] = f"Output exceeded 500 chars ({total_chars}) and could not be trimmed"
+                result["skipReason"] = f"Output exceeded {MAX_OUTPUT_CHARS} chars ({total_chars}) and could not be trimmed"
 
         result["totalChars"] = len(result.get("suggestion", "")) + len(result.get("insight", ""))
 
@@ -51,6 +51,10 @@ Respond with ONLY a JSON object:
 }"""
 
 
+_MINING_INDEX_COMMENT_RE = re.compile(r"<!--\s*mining-index:\s*[^>]*-->")
+_MINING_INDEX_MARKER_RE = re.compile(r"<!--\s*mining-index:")
+
+
 def get_unmined_files(memory_dir: str, mined_dates: list[str]) -> list[str]:
     """Find daily memory files not yet mined (not in index)."""
     all_files = list_daily_memory_files(memory_dir)
@@ -80,10 +84,14 @@ def update_mining_index(memory_dir: str, playbook: str, new_dates: list[str]) ->
         playbook_path.write_text(new_comment + "\n", encoding="utf-8")
         return
 
+    # Re-read rather than splice into `playbook`: that text was loaded before
+    # the LLM call, and the playbook may have been edited since (curator,
+    # user). Only the index dates are taken from the caller's copy.
     text = playbook_path.read_text(encoding="utf-8")
-    if re.search(r"<!--\s*mining-index:", text):
-        text = re.sub(r"<!--\s*mining-index:\s*[^>]*-->", new_comment, text)
-    else:
+    # One pass in the common case (comment present); only a playbook without
+    # a well-formed comment pays the second search.
+    text, replaced = _MINING_INDEX_COMMENT_RE.subn(new_comment, text)
+    if not replaced and not _MINING_INDEX_MARKER_RE.search(text):
         text = new_comment + "\n" + text
 
     playbook_path.write_text(text, encoding="utf-8")
@@ -111,7 +119,8 @@ def main():
     to_mine = unmined[:3]
     mined_contents = {}
     for f in to_mine:
-        content = read_file_safe(f)
+        # Very large files are truncated at read time
+        content = read_file_safe(f, max_chars=6000)
         if content:
             mined_contents[Path(f).name] = content
 
@@ -124,18 +133,13 @@ def main():
         return
 
     # Also read devmatrix-summary.md for broader context
-    devmatrix = read_file_safe(str(Path(args.memory_dir) / "devmatrix-summary.md"))
+    devmatrix = read_file_safe(str(Path(args.memory_dir) / "devmatrix-summary.md"), max_chars=3000)
 
     # Build LLM prompt
     parts = [f"## Current Playbook\n{playbook}"]
     for name, content in mined_contents.items():
-        # Truncate very large files
-        if len(content) > 6000:
-            content = content[:6000] + "\n... [truncated]"
         parts.append(f"## Daily Memory: {name}\n{content}")
     if devmatrix:
-        if len(devmatrix) > 3000:
-            devmatrix = devmatrix[:3000] + "\n... [truncated]"
         parts.append(f"## DevMatrix Summary\n{devmatrix}")
 
     # Inject graph context if triple store available
@@ -32,10 +32,44 @@ Usage:
 
 import argparse
 import json
+import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ---------------------------------------------------------------------------
+# JSON helpers (orjson when installed, stdlib otherwise)
+# ---------------------------------------------------------------------------
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(data) -> str:
+    """Compact JSON; the stdlib fallback matches orjson's output byte for byte."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _print_json(data: dict) -> None:
+    print(_dumps(data))
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write data as indented JSON with a trailing newline."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        ))
+    else:
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
 
 # ---------------------------------------------------------------------------
 # Registry helpers
@@ -49,19 +83,55 @@ def _load_registry(modules_dir: Path) -> dict:
     path = _registry_path(modules_dir)
     if not path.exists():
         return {"version": 1, "modules": {}}
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _loads(path.read_bytes())
 
 
 def _save_registry(modules_dir: Path, registry: dict) -> None:
     path = _registry_path(modules_dir)
-    path.write_text(json.dumps(registry, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    _write_json(path, registry)
 
 
 def _load_manifest(modules_dir: Path, module_id: str) -> dict | None:
     manifest_path = modules_dir / module_id / "manifest.json"
     if not manifest_path.exists():
         return None
-    return json.loads(manifest_path.read_text(encoding="utf-8"))
+    return _loads(manifest_path.read_bytes())
+
+
+def _priority_spec(manifest: dict, default: int = 70) -> tuple[int, tuple[int, int] | None]:
+    """Return (default priority, allowed (lo, hi) range or None) from a manifest."""
+    spec = manifest.get("priority")
+    if not isinstance(spec, dict):
+        return default, None
+    prio_range = spec.get("range")
+    if prio_range and len(prio_range) == 2:
+        return spec.get("default", default), (prio_range[0], prio_range[1])
+    return spec.get("default", default), None
+
+
+# Every boundary str.splitlines() splits on; \r\n counts once
+_LINE_BREAK_RE = re.compile(r"\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines exactly like str.splitlines(), in chunks instead of one list."""
+    n = 0
+    carry = ""
+    tail = ""
+    with path.open(encoding="utf-8", newline="") as f:
+        while chunk := f.read(1 << 16):
+            chunk = carry + chunk
+            # Hold back a trailing \r: the next chunk may start with its \n
+            carry = "\r" if chunk.endswith("\r") else ""
+            if carry:
+                chunk = chunk[:-1]
+            n += len(_LINE_BREAK_RE.findall(chunk))
+            tail = chunk[-1:] or tail
+    if carry:
+        return n + 1
+    if tail and not _LINE_BREAK_RE.match(tail):
+        n += 1  # unterminated final line
+    return n
 
 
 def _now_iso() -> str:
@@ -70,7 +140,7 @@ def _now_iso() -> str:
 
 def _error(msg: str) -> None:
     """Print error as JSON and exit."""
-    print(json.dumps({"error": msg}, ensure_ascii=False))
+    _print_json({"error": msg})
     sys.exit(1)
 
 
@@ -81,31 +151,33 @@ def _error(msg: str) -> None:
 def cmd_list(modules_dir: Path, _args: argparse.Namespace) -> None:
     """List all registered modules with their status."""
     registry = _load_registry(modules_dir)
+    registered = registry.get("modules", {})
+    module_dirs = {child.name: child for child in sorted(modules_dir.iterdir()) if child.is_dir()}
     modules = []
-    for mid, entry in registry.get("modules", {}).items():
-        manifest = _load_manifest(modules_dir, mid)
+    for mid, entry in registered.items():
+        manifest = _load_manifest(modules_dir, mid) if mid in module_dirs else None
         modules.append({
             "id": mid,
             "name": manifest.get("name", mid) if manifest else mid,
             "status": entry.get("status", "unknown"),
             "priority": entry.get("priority", 0),
             "locked": entry.get("locked", False),
-            "hasPatterns": (modules_dir / mid / "patterns.md").exists(),
+            "hasPatterns": mid in module_dirs and (module_dirs[mid] / "patterns.md").exists(),
         })
     # Also list unregistered module dirs
-    for child in sorted(modules_dir.iterdir()):
-        if child.is_dir() and child.name not in registry.get("modules", {}):
-            manifest = _load_manifest(modules_dir, child.name)
+    for name, child in module_dirs.items():
+        if name not in registered:
+            manifest = _load_manifest(modules_dir, name)
             if manifest:
                 modules.append({
-                    "id": child.name,
-                    "name": manifest.get("name", child.name),
+                    "id": name,
+                    "name": manifest.get("name", name),
                     "status": "unregistered",
-                    "priority": manifest.get("priority", {}).get("default", 0) if isinstance(manifest.get("priority"), dict) else 0,
+                    "priority": _priority_spec(manifest, default=0)[0],
                     "locked": False,
                     "hasPatterns": (child / "patterns.md").exists(),
                 })
-    print(json.dumps({"modules": modules}, ensure_ascii=False))
+    _print_json({"modules": modules})
 
 
 def cmd_activate(modules_dir: Path, args: argparse.Namespace) -> None:
@@ -119,17 +191,13 @@ def cmd_activate(modules_dir: Path, args: argparse.Namespace) -> None:
     entry = registry.get("modules", {}).get(module_id, {})
 
     # Determine priority
+    default_priority, prio_range = _priority_spec(manifest)
     priority = args.priority
     if priority is None:
-        priority = entry.get("priority") or (
-            manifest.get("priority", {}).get("default", 70)
-            if isinstance(manifest.get("priority"), dict)
-            else 70
-        )
+        priority = entry.get("priority") or default_priority
 
     # Validate priority against manifest range
-    prio_range = manifest.get("priority", {}).get("range") if isinstance(manifest.get("priority"), dict) else None
-    if prio_range and len(prio_range) == 2:
+    if prio_range:
         lo, hi = prio_range
         if not (lo <= priority <= hi):
             _error(f"Priority {priority} outside allowed range [{lo}, {hi}] for module '{module_id}'")
@@ -158,11 +226,11 @@ def cmd_activate(modules_dir: Path, args: argparse.Namespace) -> None:
     except Exception:
         pass
 
-    print(json.dumps({
+    _print_json({
         "activated": module_id,
         "priority": priority,
         "status": "active",
-    }, ensure_ascii=False))
+    })
 
 
 def cmd_suspend(modules_dir: Path, args: argparse.Namespace) -> None:
@@ -192,7 +260,7 @@ def cmd_suspend(modules_dir: Path, args: argparse.Namespace) -> None:
     except Exception:
         pass
 
-    print(json.dumps({"suspended": module_id}, ensure_ascii=False))
+    _print_json({"suspended": module_id})
 
 
 def cmd_priority(modules_dir: Path, args: argparse.Namespace) -> None:
@@ -205,8 +273,8 @@ def cmd_priority(modules_dir: Path, args: argparse.Namespace) -> None:
         _error(f"Module '{module_id}' not found")
 
     # Validate against manifest range
-    prio_range = manifest.get("priority", {}).get("range") if isinstance(manifest.get("priority"), dict) else None
-    if prio_range and len(prio_range) == 2:
+    _, prio_range = _priority_spec(manifest)
+    if prio_range:
         lo, hi = prio_range
         if not (lo <= new_priority <= hi):
             _error(f"Priority {new_priority} outside allowed range [{lo}, {hi}]")
@@ -218,10 +286,10 @@ def cmd_priority(modules_dir: Path, args: argparse.Namespace) -> None:
 
     entry["priority"] = new_priority
     _save_registry(modules_dir, registry)
-    print(json.dumps({
+    _print_json({
         "module": module_id,
         "priority": new_priority,
-    }, ensure_ascii=False))
+    })
 
 
 def cmd_stack(modules_dir: Path, _args: argparse.Namespace) -> None:
@@ -235,12 +303,13 @@ def cmd_stack(modules_dir: Path, _args: argparse.Namespace) -> None:
             "priority": entry.get("priority", 0),
             "locked": entry.get("locked", False),
         }
-        if entry.get("status") == "active":
+        status = entry.get("status")
+        if status == "active":
             active.append(info)
-        elif entry.get("status") == "suspended":
+        elif status == "suspended":
             suspended.append(info)
     active.sort(key=lambda m: m["priority"], reverse=True)
-    print(json.dumps({"active": active, "suspended": suspended}, ensure_ascii=False))
+    _print_json({"active": active, "suspended": suspended})
 
 
 def cmd_info(modules_dir: Path, args: argparse.Namespace) -> None:
@@ -256,21 +325,21 @@ def cmd_info(modules_dir: Path, args: argparse.Namespace) -> None:
     patterns_path = modules_dir / module_id / "patterns.md"
     patterns_lines = 0
     if patterns_path.exists():
-        patterns_lines = len(patterns_path.read_text(encoding="utf-8").splitlines())
+        patterns_lines = _count_lines(patterns_path)
 
     guidance_path = modules_dir / module_id / "guidance.md"
     guidance_chars = 0
     if guidance_path.exists():
         guidance_chars = len(guidance_path.read_text(encoding="utf-8"))
 
-    print(json.dumps({
+    _print_json({
         "id": module_id,
         "manifest": manifest,
         "registry": entry if entry else None,
         "patternsLines": patterns_lines,
         "patternsPath": str(patterns_path),
         "guidanceChars": guidance_chars,
-    }, ensure_ascii=False))
+    })
 
 
 def cmd_guidance(modules_dir: Path, args: argparse.Namespace) -> None:
@@ -286,25 +355,25 @@ def cmd_guidance(modules_dir: Path, args: argparse.Namespace) -> None:
     if args.clear:
         if guidance_path.exists():
             guidance_path.unlink()
-        print(json.dumps({"module": module_id, "guidance": "", "cleared": True}, ensure_ascii=False))
+        _print_json({"module": module_id, "guidance": "", "cleared": True})
         return
 
     if args.set is not None:
         guidance_path.write_text(args.set, encoding="utf-8")
-        print(json.dumps({
+        _print_json({
             "module": module_id,
             "guidanceChars": len(args.set),
             "written": True,
-        }, ensure_ascii=False))
+        })
         return
 
     # Default: view
     guidance = guidance_path.read_text(encoding="utf-8") if guidance_path.exists() else ""
-    print(json.dumps({
+    _print_json({
         "module": module_id,
         "hasGuidance": bool(guidance),
         "guidance": guidance,
-    }, ensure_ascii=False))
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -359,21 +428,23 @@ def cmd_extract(modules_dir: Path, args: argparse.Namespace) -> None:
     except Exception:
         pass  # triple store unavailable — proceed without
 
-    # Build user prompt
-    parts = [f"## Domain: {domain}"]
+    # Build user prompt (playbook first so it is a shared, cacheable prefix
+    # across extractions for different domains)
+    parts = []
     if playbook:
-        parts.append(f"\n## Playbook Content\n{playbook}")
+        parts += ["## Playbook Content", playbook, ""]
+    parts.append(f"## Domain: {domain}")
     if recent_logs:
-        # Summarize logs (keep it compact)
-        log_entries = []
+        # Summarize logs (keep it compact). Entries go straight into parts,
+        # one JSON line each, so the prompt is assembled by a single join.
+        parts.append("\n## Recent Log Entries (last 7 days)")
         for entry in recent_logs[:20]:
-            log_entries.append(json.dumps({
+            parts.append(_dumps({
                 "ts": entry.get("ts", "?"),
                 "signals": entry.get("signals", []),
                 "playbookChanges": entry.get("playbookChanges"),
                 "output": entry.get("output"),
-            }, ensure_ascii=False))
-        parts.append(f"\n## Recent Log Entries (last 7 days)\n" + "\n".join(log_entries))
+            }))
     if kg_context:
         parts.append(f"\n## Knowledge Graph Context\n{kg_context}")
     if min_score:
@@ -410,9 +481,7 @@ def cmd_extract(modules_dir: Path, args: argparse.Namespace) -> None:
         "extractedAt": _now_iso(),
         "source": "module_manager extract",
     }
-    (module_dir / "manifest.json").write_text(
-        json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
-    )
+    _write_json(module_dir / "manifest.json", manifest)
 
     # Generate patterns.md
     lines = [f"# {domain}\n"]
@@ -445,7 +514,7 @@ def cmd_extract(modules_dir: Path, args: argparse.Namespace) -> None:
     }
     _save_registry(modules_dir, registry)
 
-    print(json.dumps({
+    _print_json({
         "extracted": module_id,
         "domain": domain,
         "patternsEstablished": len(established),
@@ -454,7 +523,7 @@ def cmd_extract(modules_dir: Path, args: argparse.Namespace) -> None:
         "modulePath": str(module_dir),
         "status": "suspended",
         "activateWith": f"python3 module_manager.py --modules-dir {modules_dir} activate {module_id}",
-    }, ensure_ascii=False))
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -500,15 +569,15 @@ def cmd_export(modules_dir: Path, args: argparse.Namespace) -> None:
     }
 
     output_path = Path(args.output) if args.output else Path(f"{module_id}.sinain-module.json")
-    output_path.write_text(json.dumps(bundle, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    _write_json(output_path, bundle)
 
-    print(json.dumps({
+    _print_json({
         "exported": module_id,
         "outputPath": str(output_path),
         "patternsChars": len(patterns),
         "guidanceChars": len(guidance),
         "contextFiles": len(context),
-    }, ensure_ascii=False))
+    })
 
 
 def cmd_import(modules_dir: Path, args: argparse.Namespace) -> None:
@@ -518,7 +587,7 @@ def cmd_import(modules_dir: Path, args: argparse.Namespace) -> None:
         _error(f"Bundle file not found: {bundle_path}")
 
     try:
-        bundle = json.loads(bundle_path.read_text(encoding="utf-8"))
+        bundle = _loads(bundle_path.read_bytes())
     except (json.JSONDecodeError, UnicodeDecodeError) as e:
         _error(f"Invalid bundle file: {e}")
 
@@ -544,9 +613,7 @@ def cmd_import(modules_dir: Path, args: argparse.Namespace) -> None:
     manifest["importedAt"] = _now_iso()
     manifest["source"] = "module_manager import"
     manifest["importedFrom"] = str(bundle_path.name)
-    (module_dir / "manifest.json").write_text(
-        json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
-    )
+    _write_json(module_dir / "manifest.json", manifest)
 
     # Write patterns
     patterns = bundle.get("patterns", "")
@@ -569,7 +636,7 @@ def cmd_import(modules_dir: Path, args: argparse.Namespace) -> None:
     # Register in registry
     registry = _load_registry(modules_dir)
     status = "active" if args.activate else "suspended"
-    priority = manifest.get("priority", {}).get("default", 70) if isinstance(manifest.get("priority"), dict) else 70
+    priority, _ = _priority_spec(manifest)
     registry.setdefault("modules", {})[module_id] = {
         "status": status,
         "priority": priority,
@@ -594,14 +661,14 @@ def cmd_import(modules_dir: Path, args: argparse.Namespace) -> None:
         except Exception:
             pass
 
-    print(json.dumps({
+    _print_json({
         "imported": module_id,
         "status": status,
         "priority": priority,
         "patternsChars": len(patterns),
         "contextFiles": len(context),
         "modulePath": str(module_dir),
-    }, ensure_ascii=False))
+    })
 
 
 # ---------------------------------------------------------------------------
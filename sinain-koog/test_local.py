@@ -225,7 +225,7 @@ def test_llm_error():
     # Test 1: Timeout raises LLMError
     import requests as req_mod
     with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}):
-        with patch("common.requests.post", side_effect=req_mod.exceptions.Timeout("Connection timed out")):
+        with patch("common._SESSION.post", side_effect=req_mod.exceptions.Timeout("Connection timed out")):
             try:
                 call_llm("system", "user")
                 print("  FAIL: timeout — expected LLMError but call succeeded")
@@ -243,7 +243,7 @@ def test_llm_error():
 
     # Test 2: ConnectionError raises LLMError
     with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}):
-        with patch("common.requests.post", side_effect=req_mod.exceptions.ConnectionError("DNS failed")):
+        with patch("common._SESSION.post", side_effect=req_mod.exceptions.ConnectionError("DNS failed")):
             try:
                 call_llm("system", "user")
                 print("  FAIL: connection error — expected LLMError")
@@ -263,7 +263,7 @@ def test_llm_error():
     with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}):
         mock_resp = MagicMock()
         mock_resp.raise_for_status.side_effect = req_mod.exceptions.HTTPError("500 Server Error")
-        with patch("common.requests.post", return_value=mock_resp):
+        with patch("common._SESSION.post", return_value=mock_resp):
             try:
                 call_llm("system", "user")
                 print("  FAIL: HTTP 500 — expected LLMError")
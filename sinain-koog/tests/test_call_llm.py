@@ -0,0 +1,182 @@
+"""Tests for common.py call_llm / call_llm_stream: config resolution, session, SSE parsing."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import requests
+
+import common
+from common import LLMError, _script_table, call_llm, call_llm_stream
+
+
+def _mock_chat_response(content: str = "ok"):
+    return SimpleNamespace(
+        json=lambda: {"choices": [{"message": {"content": content}}]},
+        raise_for_status=lambda: None,
+    )
+
+
+@pytest.fixture
+def koog_config():
+    cfg = {
+        "models": {"fast": "fast/model", "smart": "anthropic/smart-model"},
+        "scripts": {
+            "miner": {"model": "smart", "maxTokens": 900, "timeout": 45},
+            "bare": {"model": "fast"},
+            "cached": {"model": "smart", "cacheSystemPrompt": True},
+            "cached_fast": {"model": "fast", "cacheSystemPrompt": True},
+        },
+        "defaults": {"model": "fast", "maxTokens": 1500, "timeout": 20},
+    }
+    _script_table.cache_clear()
+    with patch.object(common, "_load_config", return_value=cfg):
+        yield cfg
+    _script_table.cache_clear()
+
+
+class TestScriptTable:
+    def test_resolves_models(self, koog_config):
+        table = _script_table()
+        assert table["miner"] == ("anthropic/smart-model", 900, 45, False)
+
+    def test_missing_fields_inherit_defaults(self, koog_config):
+        table = _script_table()
+        assert table["bare"] == ("fast/model", None, 20, False)
+        assert table[None] == ("fast/model", 1500, 20, False)
+
+
+@patch.dict("os.environ", {"OPENROUTER_API_KEY": "test-key"})
+class TestCallLLMConfig:
+    @patch("common._SESSION.post")
+    def test_script_overrides_model_and_tokens(self, mock_post, koog_config):
+        mock_post.return_value = _mock_chat_response()
+        call_llm("sys", "user", script="miner")
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["json"]["model"] == "anthropic/smart-model"
+        assert kwargs["json"]["max_tokens"] == 900
+        assert kwargs["timeout"] == 45
+
+    @patch("common._SESSION.post")
+    def test_unknown_script_uses_defaults(self, mock_post, koog_config):
+        mock_post.return_value = _mock_chat_response()
+        call_llm("sys", "user", script="nope", max_tokens=10)
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["json"]["model"] == "fast/model"
+        assert kwargs["json"]["max_tokens"] == 1500
+        assert kwargs["timeout"] == 20
+
+    @patch("common._SESSION.post")
+    def test_script_without_max_tokens_keeps_caller_value(self, mock_post, koog_config):
+        mock_post.return_value = _mock_chat_response()
+        call_llm("sys", "user", script="bare", max_tokens=321)
+        assert mock_post.call_args.kwargs["json"]["max_tokens"] == 321
+
+    @patch("common._SESSION.post")
+    def test_cache_flag_marks_anthropic_system_prompt(self, mock_post, koog_config):
+        mock_post.return_value = _mock_chat_response()
+        call_llm("stable system", "user", script="cached")
+        system = mock_post.call_args.kwargs["json"]["messages"][0]["content"]
+        assert system == [
+            {"type": "text", "text": "stable system", "cache_control": {"type": "ephemeral"}},
+        ]
+
+    @patch("common._SESSION.post")
+    def test_cache_flag_ignored_for_other_providers(self, mock_post, koog_config):
+        mock_post.return_value = _mock_chat_response()
+        call_llm("stable system", "user", script="cached_fast")
+        assert mock_post.call_args.kwargs["json"]["messages"][0]["content"] == "stable system"
+
+
+class TestSession:
+    def test_session_sends_json_content_type(self):
+        assert common._SESSION.headers["Content-Type"] == "application/json"
+
+    def test_https_adapter_retries_transient_statuses(self):
+        retry = common._SESSION.get_adapter(common.OPENROUTER_URL).max_retries
+        assert set(retry.status_forcelist) == {429, 502, 503, 504}
+        assert retry.is_retry("POST", 503)
+        assert not retry.is_retry("POST", 400)
+        assert retry.read == 0
+        assert retry.respect_retry_after_header is False
+
+    @patch.dict("os.environ", {"OPENROUTER_API_KEY": "test-key"})
+    @patch("common._SESSION.post")
+    def test_calls_reuse_module_session(self, mock_post):
+        mock_post.return_value = _mock_chat_response()
+        call_llm("sys", "user")
+        call_llm("sys", "user")
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.kwargs["headers"] == {"Authorization": "Bearer test-key"}
+
+
+class _StreamResponse:
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        return iter(self._lines)
+
+
+@patch.dict("os.environ", {"OPENROUTER_API_KEY": "test-key"})
+class TestCallLLMStream:
+    @patch("common._SESSION.post")
+    def test_yields_deltas_until_done(self, mock_post):
+        mock_post.return_value = _StreamResponse([
+            b": OPENROUTER PROCESSING",
+            b'data: {"choices": [{"delta": {"content": "Hel"}}]}',
+            b"",
+            b'data: {"choices": [{"delta": {"content": "lo"}}]}',
+            b'data: {"choices": [{"delta": {}}], "usage": {"total_tokens": 5}}',
+            b"data: [DONE]",
+            b'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+        ])
+        assert "".join(call_llm_stream("sys", "user")) == "Hello"
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["json"]["stream"] is True
+
+    @patch("common._SESSION.post")
+    def test_call_llm_stream_flag_joins_deltas(self, mock_post):
+        mock_post.return_value = _StreamResponse([
+            b'data: {"choices": [{"delta": {"content": "{\\"a\\": "}}]}',
+            b'data: {"choices": [{"delta": {"content": "1}"}}]}',
+            b"data: [DONE]",
+        ])
+        assert call_llm("sys", "user", stream=True) == '{"a": 1}'
+        assert mock_post.call_args.kwargs["stream"] is True
+
+    @patch("common._SESSION.post")
+    def test_empty_stream_raises(self, mock_post):
+        mock_post.return_value = _StreamResponse([b"data: [DONE]"])
+        with pytest.raises(LLMError):
+            list(call_llm_stream("sys", "user"))
+
+    @patch("common._SESSION.post")
+    def test_stream_past_deadline_raises(self, mock_post):
+        mock_post.return_value = _StreamResponse([
+            b'data: {"choices": [{"delta": {"content": "slow"}}]}',
+            b'data: {"choices": [{"delta": {"content": "er"}}]}',
+            b"data: [DONE]",
+        ])
+        clock = iter([0.0, 1.0, 1000.0])
+        with patch("common.time.monotonic", lambda: next(clock)):
+            stream = call_llm_stream("sys", "user")
+            assert next(stream) == "slow"
+            with pytest.raises(LLMError, match="exceeded"):
+                next(stream)
+
+    @patch("common._SESSION.post")
+    def test_transport_error_raises_llm_error(self, mock_post):
+        mock_post.side_effect = requests.exceptions.ConnectionError("down")
+        with pytest.raises(LLMError, match="ConnectionError"):
+            list(call_llm_stream("sys", "user"))
@@ -6,7 +6,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from triplestore import TripleStore
-from embedder import Embedder, _vec_to_blob, _blob_to_vec, _text_hash, _dot, _norm
+from embedder import Embedder, _vec_to_blob, _blob_to_vec, _text_hash
 
 
 @pytest.fixture
@@ -55,17 +55,6 @@ class TestTextHash:
         assert len(_text_hash("test")) == 16
 
 
-class TestDotAndNorm:
-    def test_dot_product(self):
-        assert _dot([1, 2, 3], [4, 5, 6]) == 32
-
-    def test_norm(self):
-        assert abs(_norm([3, 4]) - 5.0) < 1e-6
-
-    def test_unit_vector_norm(self):
-        assert abs(_norm([1, 0, 0]) - 1.0) < 1e-6
-
-
 # ----- Embedder with mocked API -----
 
 def _mock_openrouter_response(texts):
@@ -194,6 +183,40 @@ class TestVectorSearch:
         assert len(results) == 1
         assert results[0][0] == "pattern:x"
 
+    def test_scores_are_cosine_similarity(self, embedder):
+        from embedder import _vec_to_blob, _now_iso
+        for eid, vec in [("pattern:a", [3.0, 4.0]), ("pattern:b", [-2.0, 0.0])]:
+            embedder._conn.execute(
+                "INSERT INTO embeddings (entity_id, vector, text_hash, model, dimensions, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (eid, _vec_to_blob(vec), "hash", "test", 2, _now_iso()),
+            )
+        embedder._conn.commit()
+
+        # Scale-invariant in the query: [5, 0] scores the same as [1, 0]
+        results = dict(embedder.vector_search([5.0, 0.0], top_k=5))
+        assert abs(results["pattern:a"] - 0.6) < 1e-6
+        assert abs(results["pattern:b"] + 1.0) < 1e-6
+
+    def test_search_skips_mismatched_and_zero_vectors(self, embedder):
+        from embedder import _vec_to_blob, _now_iso
+        for eid, vec in [
+            ("pattern:wide", [1.0, 0.0, 0.0]),
+            ("pattern:zero", [0.0, 0.0]),
+            ("pattern:low", [0.0, 1.0]),
+            ("pattern:high", [1.0, 1.0]),
+        ]:
+            embedder._conn.execute(
+                "INSERT INTO embeddings (entity_id, vector, text_hash, model, dimensions, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (eid, _vec_to_blob(vec), "hash", "test", len(vec), _now_iso()),
+            )
+        embedder._conn.commit()
+
+        results = embedder.vector_search([1.0, 0.0], top_k=5)
+        assert [eid for eid, _ in results] == ["pattern:high", "pattern:low"]
+        assert abs(results[0][1] - 2 ** -0.5) < 1e-6
+
 
 # ----- Schema -----
 
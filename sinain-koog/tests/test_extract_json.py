@@ -22,6 +22,11 @@ class TestStage1DirectParse:
         result = extract_json('{"msg": "привет мир"}')
         assert result["msg"] == "привет мир"
 
+    def test_stdlib_only_literals_still_parse(self):
+        # NaN is rejected by orjson but accepted by the stdlib fallback stages
+        result = extract_json('{"score": NaN, "n": 1}')
+        assert result["n"] == 1
+
 
 class TestStage2MarkdownFences:
     def test_fenced_json(self):
@@ -73,6 +78,14 @@ class TestStage3BalancedBrace:
         result = extract_json(r'{"msg": "he said \"hello\"", "ok": true}')
         assert result["ok"] is True
 
+    def test_escaped_backslash_before_closing_quote(self):
+        result = extract_json(r'Path: {"dir": "C:\\", "brace": "}"} done')
+        assert result == {"dir": "C:\\", "brace": "}"}
+
+    def test_escaped_quote_then_brace_in_string(self):
+        result = extract_json(r'note {"a": "x\"}y", "b": [1, {"c": 2}]} tail')
+        assert result == {"a": 'x"}y', "b": [1, {"c": 2}]}
+
 
 class TestStage4TruncationRepair:
     def test_missing_closing_brace(self):
@@ -1,6 +1,14 @@
-"""Tests for feedback_analyzer.py: compute_effectiveness() and determine_directive()."""
+"""Tests for feedback_analyzer.py: compute_effectiveness(), determine_directive(), score trend."""
 
-from feedback_analyzer import compute_effectiveness, determine_directive, extract_feedback_scores
+import numpy as np
+
+from feedback_analyzer import (
+    compute_effectiveness,
+    compute_score_trend,
+    determine_directive,
+    extract_feedback_scores,
+    log_columns,
+)
 
 
 class TestComputeEffectiveness:
@@ -55,6 +63,15 @@ class TestComputeEffectiveness:
         assert result["neutral"] == 1
         assert result["rate"] == round(1 / 3, 2)
 
+    def test_next_tick_without_score_is_neutral(self):
+        logs = [
+            {"ts": "2026-02-28T10:00:00Z", "skipped": False},
+            {"ts": "2026-02-28T10:30:00Z", "skipped": False},
+            {"ts": "2026-02-28T11:00:00Z", "feedbackScores": {"avg": 0.9}},
+        ]
+        result = compute_effectiveness(logs)
+        assert (result["positive"], result["negative"], result["neutral"]) == (1, 0, 1)
+
     def test_rate_is_rounded(self):
         logs = [
             {"ts": f"2026-02-28T1{i}:00:00Z", "skipped": False}
@@ -119,3 +136,55 @@ class TestExtractFeedbackScores:
         ]
         result = extract_feedback_scores(logs)
         assert len(result["high"]) <= 5
+
+    def test_keeps_newest_distinct_patterns(self):
+        logs = [
+            {"feedbackScores": {"avg": 0.1, "high": [f"p{i}", "p0"], "low": []}}
+            for i in range(10)
+        ]  # newest first
+        result = extract_feedback_scores(logs)
+        assert result["high"] == ["p0", "p1", "p2", "p3", "p4"]
+
+
+class TestLogColumns:
+    def test_sorted_oldest_first_with_defaults(self):
+        logs = [
+            {"ts": "2026-02-28T11:00:00Z", "skipped": False, "feedbackScores": {"avg": 0.4}},
+            {"ts": "2026-02-28T10:00:00Z"},
+            {"ts": "2026-02-28T12:00:00Z", "skipped": True, "feedbackScores": None},
+        ]
+        cols = log_columns(logs)
+        assert cols.skipped.tolist() == [True, False, True]
+        assert np.isnan(cols.avg[0]) and np.isnan(cols.avg[2])
+        assert cols.avg[1] == 0.4
+
+    def test_empty(self):
+        cols = log_columns([])
+        assert len(cols.skipped) == 0 and len(cols.avg) == 0
+
+
+class TestComputeScoreTrend:
+    @staticmethod
+    def _logs(scores):
+        return [
+            {"ts": f"2026-02-28T{10 + i:02d}:00:00Z", "feedbackScores": {"avg": s}}
+            for i, s in enumerate(scores)
+        ]
+
+    def test_insufficient(self):
+        assert compute_score_trend(self._logs([0.1, 0.2])) == "insufficient"
+
+    def test_rising_ignores_entries_without_scores(self):
+        logs = self._logs([0.0, 0.1, 0.2, 0.4, 0.5, 0.6])
+        logs.append({"ts": "2026-02-28T09:00:00Z"})
+        assert compute_score_trend(logs) == "rising"
+
+    def test_accepts_prebuilt_columns(self):
+        logs = self._logs([0.0, 0.1, 0.2, 0.4, 0.5, 0.6])
+        cols = log_columns(logs)
+        assert compute_score_trend(cols) == compute_score_trend(logs) == "rising"
+        assert compute_effectiveness(cols) == compute_effectiveness(logs)
+
+    def test_falling_and_flat(self):
+        assert compute_score_trend(self._logs([0.6, 0.5, 0.4, 0.1, 0.0, -0.1])) == "falling"
+        assert compute_score_trend(self._logs([0.3, 0.3, 0.3])) == "flat"
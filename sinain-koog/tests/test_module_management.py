@@ -7,6 +7,7 @@ from unittest.mock import patch
 import argparse
 import pytest
 
+import module_manager
 from module_manager import (
     cmd_list,
     cmd_activate,
@@ -17,7 +18,9 @@ from module_manager import (
     cmd_guidance,
     cmd_export,
     cmd_import,
+    _dumps,
     _load_registry,
+    _priority_spec,
     _save_registry,
 )
 
@@ -50,6 +53,38 @@ class TestCmdList:
         result = _capture_stdout(cmd_list, modules)
         assert result["modules"] == []
 
+    def test_registered_without_dir(self, tmp_modules_dir):
+        reg = _load_registry(tmp_modules_dir)
+        reg["modules"]["ghost"] = {"status": "suspended", "priority": 10}
+        _save_registry(tmp_modules_dir, reg)
+        modules = {m["id"]: m for m in _capture_stdout(cmd_list, tmp_modules_dir)["modules"]}
+        assert modules["ghost"]["name"] == "ghost"
+        assert modules["ghost"]["hasPatterns"] is False
+
+
+class TestPrioritySpec:
+    def test_default_and_range(self):
+        assert _priority_spec({"priority": {"default": 85, "range": [50, 100]}}) == (85, (50, 100))
+
+    def test_missing_or_malformed(self):
+        assert _priority_spec({}) == (70, None)
+        assert _priority_spec({"priority": 90}, default=0) == (0, None)
+        assert _priority_spec({"priority": {"range": [1, 2, 3]}}) == (70, None)
+
+
+class TestJsonHelpers:
+    SAMPLE = {"name": "Café ✓", "n": 1, "ok": True, "none": None, "items": [1, {"a": []}],
+              "empty": {}, 3: "int key"}
+
+    def test_stdlib_fallback_matches_orjson(self, tmp_path, monkeypatch):
+        pytest.importorskip("orjson")
+        fast = _dumps(self.SAMPLE)
+        module_manager._write_json(tmp_path / "fast.json", self.SAMPLE)
+        monkeypatch.setattr(module_manager, "orjson", None)
+        assert _dumps(self.SAMPLE) == fast
+        module_manager._write_json(tmp_path / "slow.json", self.SAMPLE)
+        assert (tmp_path / "slow.json").read_bytes() == (tmp_path / "fast.json").read_bytes()
+
 
 class TestCmdActivate:
     def test_activate_suspended_module(self, tmp_modules_dir):
@@ -158,6 +193,15 @@ class TestCmdInfo:
         result = _capture_stdout(cmd_info, tmp_modules_dir, {"module_id": "react-native-dev"})
         assert result["guidanceChars"] == len(guidance)
 
+    @pytest.mark.parametrize("text", [
+        "", "one", "one\n", "a\nb", "a\n\nb\n",
+        "a\rb", "a\r\nb", "a\r\n", "a\r", "\r\r\n", "a\u2028b\x0cc",
+    ])
+    def test_patterns_lines_match_splitlines(self, tmp_modules_dir, text):
+        (tmp_modules_dir / "react-native-dev" / "patterns.md").write_bytes(text.encode("utf-8"))
+        result = _capture_stdout(cmd_info, tmp_modules_dir, {"module_id": "react-native-dev"})
+        assert result["patternsLines"] == len(text.splitlines())
+
     def test_nonexistent_module(self, tmp_modules_dir):
         with pytest.raises(SystemExit):
             _capture_stdout(cmd_info, tmp_modules_dir, {"module_id": "nonexistent"})
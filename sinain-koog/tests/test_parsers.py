@@ -1,6 +1,10 @@
-"""Tests for common.py parser functions: parse_module_stack, parse_mining_index, parse_effectiveness."""
+"""Tests for common.py playbook parsers, log readers and output_json."""
 
-from common import parse_module_stack, parse_mining_index, parse_effectiveness
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+
+from common import _read_jsonl, output_json, read_file_safe, read_recent_logs, parse_module_stack, parse_mining_index, parse_effectiveness
 
 
 class TestParseModuleStack:
@@ -94,3 +98,110 @@ class TestParseEffectiveness:
         text = "<!-- effectiveness: updated=2026-02-21 -->"
         result = parse_effectiveness(text)
         assert result["updated"] == "2026-02-21"
+
+
+class TestReadJsonl:
+    def test_skips_blank_and_malformed_lines(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_text('{"a": 1}\n\n  \nnot json\n{"b": "\u00e9"}\n{"c": 3}', encoding="utf-8")
+        assert _read_jsonl(path) == [{"a": 1}, {"b": "\u00e9"}, {"c": 3}]
+
+    def test_missing_file(self, tmp_path):
+        assert _read_jsonl(tmp_path / "absent.jsonl") == []
+
+
+class TestReadFileSafe:
+    def test_missing_file(self, tmp_path):
+        assert read_file_safe(str(tmp_path / "absent.md")) == ""
+        assert read_file_safe(str(tmp_path / "absent.md"), max_chars=10) == ""
+
+    def test_short_file_untouched(self, tmp_path):
+        path = tmp_path / "note.md"
+        path.write_text("caf\u00e9 notes", encoding="utf-8")
+        assert read_file_safe(str(path), max_chars=10) == "caf\u00e9 notes"
+
+    def test_truncates_at_max_chars(self, tmp_path):
+        path = tmp_path / "note.md"
+        path.write_text("\u00e9" * 11, encoding="utf-8")
+        assert read_file_safe(str(path), max_chars=10) == "\u00e9" * 10 + "\n... [truncated]"
+
+
+class TestReadRecentLogs:
+    @staticmethod
+    def _write_day(log_dir, date, stamps):
+        lines = [json.dumps({"ts": f"{date}T{t}Z", "n": t}) for t in stamps]
+        (log_dir / f"{date}.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def test_newest_first_across_days(self, tmp_path):
+        log_dir = tmp_path / "playbook-logs"
+        log_dir.mkdir()
+        today = datetime.now(timezone.utc)
+        d0 = today.strftime("%Y-%m-%d")
+        d1 = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+        old = (today - timedelta(days=30)).strftime("%Y-%m-%d")
+        self._write_day(log_dir, d0, ["08:00:00", "09:30:00", "09:00:00"])
+        self._write_day(log_dir, d1, ["23:00:00", "01:00:00"])
+        self._write_day(log_dir, old, ["12:00:00"])
+        (log_dir / "notes.jsonl").write_text('{"ts": "zzz"}\n', encoding="utf-8")
+
+        ts = [e["ts"] for e in read_recent_logs(str(tmp_path), days=7)]
+        assert ts == sorted(ts, reverse=True)
+        assert len(ts) == 5
+        assert ts[0] == f"{d0}T09:30:00Z"
+
+    def test_day_window_boundary(self, tmp_path):
+        log_dir = tmp_path / "playbook-logs"
+        log_dir.mkdir()
+        today = datetime.now(timezone.utc)
+        inside = (today - timedelta(days=6)).strftime("%Y-%m-%d")
+        outside = (today - timedelta(days=7)).strftime("%Y-%m-%d")
+        self._write_day(log_dir, inside, ["12:00:00"])
+        self._write_day(log_dir, outside, ["12:00:00"])
+        ts = [e["ts"] for e in read_recent_logs(str(tmp_path), days=7)]
+        assert ts == [f"{inside}T12:00:00Z"]
+
+    def test_impossible_dates_skipped(self, tmp_path):
+        log_dir = tmp_path / "playbook-logs"
+        log_dir.mkdir()
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        year = today[:4]
+        self._write_day(log_dir, today, ["12:00:00"])
+        self._write_day(log_dir, f"{year}-13-45", ["12:00:00"])
+        self._write_day(log_dir, f"{year}-12-32", ["12:00:00"])
+        ts = [e["ts"] for e in read_recent_logs(str(tmp_path), days=7)]
+        assert ts == [f"{today}T12:00:00Z"]
+
+    def test_missing_dir(self, tmp_path):
+        assert read_recent_logs(str(tmp_path)) == []
+
+
+class TestOutputJson:
+    def test_prints_compact_utf8_line(self, capsys):
+        print("before")
+        output_json({"msg": "café", "n": 1, 2: "int key"})
+        out = capsys.readouterr().out.splitlines()
+        assert out[0] == "before"
+        assert json.loads(out[1]) == {"msg": "café", "n": 1, "2": "int key"}
+        assert "café" in out[1]
+
+    def test_writes_to_replaced_text_stdout(self):
+        import contextlib
+        import io
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            output_json({"ok": True})
+        assert json.loads(buf.getvalue()) == {"ok": True}
+
+    def test_writes_bytes_through_stdout_buffer(self, monkeypatch):
+        import io
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        monkeypatch.setattr(sys, "stdout", stream)
+        print("before")
+        output_json({"msg": "café"})
+        print("after")
+        stream.flush()
+        lines = raw.getvalue().decode("utf-8").splitlines()
+        assert lines[0] == "before"
+        assert json.loads(lines[1]) == {"msg": "café"}
+        assert lines[2] == "after"
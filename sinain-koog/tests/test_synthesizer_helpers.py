@@ -0,0 +1,60 @@
+"""Tests for insight_synthesizer.py: SuggestionBudget streaming budget check."""
+
+from insight_synthesizer import MAX_OUTPUT_CHARS, SuggestionBudget, suggestion_overflows
+
+
+def _partial(suggestion_body: str) -> str:
+    return '{"skip": false, "suggestion": "' + suggestion_body
+
+
+class TestSuggestionOverflows:
+    def test_no_suggestion_yet(self):
+        assert not suggestion_overflows('{"skip": fal')
+
+    def test_within_budget(self):
+        assert not suggestion_overflows(_partial("a" * MAX_OUTPUT_CHARS))
+
+    def test_over_budget_while_streaming(self):
+        assert suggestion_overflows(_partial("a" * (MAX_OUTPUT_CHARS + 1)))
+
+    def test_escapes_count_as_decoded_chars(self):
+        # 300 "\n" escapes are 600 raw chars but only 300 characters
+        assert not suggestion_overflows(_partial("\\n" * 300))
+
+    def test_dangling_escape_is_ignored(self):
+        body = "a" * MAX_OUTPUT_CHARS + "\\"
+        assert not suggestion_overflows(_partial(body))
+        assert suggestion_overflows(_partial(body + "u00e9"))
+
+    def test_long_insight_alone_does_not_abort(self):
+        text = '{"suggestion": "short", "insight": "' + "b" * 2000
+        assert not suggestion_overflows(text)
+
+
+class TestSuggestionBudget:
+    def _feed(self, text: str, size: int) -> int | None:
+        """Feed text in size-char deltas; return the offset where it overflowed."""
+        budget = SuggestionBudget()
+        for i in range(0, len(text), size):
+            if budget.feed(text[i:i + size]):
+                return i + size
+        return None
+
+    def test_key_split_across_deltas(self):
+        text = '{"skip": false, "suggestion": "' + "a" * (MAX_OUTPUT_CHARS + 1) + '"}'
+        assert self._feed(text, 3) is not None
+
+    def test_trips_at_first_char_over_budget(self):
+        head = '{"suggestion": "'
+        text = head + "a" * (MAX_OUTPUT_CHARS + 50)
+        assert self._feed(text, 1) == len(head) + MAX_OUTPUT_CHARS + 1
+
+    def test_split_escapes_and_surrogate_pairs(self):
+        # each \ud83d\ude00 pair is one decoded char
+        body = "\\ud83d\\ude00" * MAX_OUTPUT_CHARS
+        assert self._feed('{"suggestion": "' + body + '", "insight": ""}', 5) is None
+        assert self._feed('{"suggestion": "' + body + "\\n", 5) is not None
+
+    def test_closed_suggestion_stops_counting(self):
+        text = '{"suggestion": "short", "insight": "' + "b" * 2000
+        assert self._feed(text, 7) is None
@@ -57,8 +57,9 @@ class AudioCapture:
         def _audio_callback(indata, frames, time_info, status):
             if status:
                 log.debug("Audio status: %s", status)
-            # Convert float32 → int16 PCM
-            pcm = (indata[:, 0] * 32767).astype("int16").tobytes()
+            # Mono int16 frames from the driver are already s16le PCM;
+            # tobytes() copies out of the buffer sounddevice reuses
+            pcm = indata.tobytes()
             try:
                 loop.call_soon_threadsafe(audio_queue.put_nowait, pcm)
             except asyncio.QueueFull:
@@ -69,7 +70,7 @@ class AudioCapture:
                 device=self.device,
                 samplerate=self.sample_rate,
                 channels=1,
-                dtype="float32",
+                dtype="int16",
                 blocksize=self.frame_samples,
                 callback=_audio_callback,
             )
@@ -81,7 +82,9 @@ class AudioCapture:
         log.info("Audio capture started (rate=%dHz, vad=%d, device=%s)",
                  self.sample_rate, self.vad_aggressiveness, self.device)
 
-        speech_buffer = bytearray()
+        # Frames are kept as a list and joined once per chunk, instead of
+        # growing (and reallocating) one buffer every 30ms
+        speech_frames: list[bytes] = []
         speech_start = 0.0
         silence_start = 0.0
         in_speech = False
@@ -109,33 +112,33 @@ class AudioCapture:
                     if not in_speech:
                         in_speech = True
                         speech_start = now
-                        speech_buffer = bytearray()
+                        speech_frames = []
                         log.debug("Speech started")
                     silence_start = 0.0
-                    speech_buffer.extend(pcm_data)
+                    speech_frames.append(pcm_data)
 
                     # Check max duration
                     duration = now - speech_start
                     if duration >= self.max_chunk_duration:
-                        await self._emit_chunk(speech_buffer, speech_start,
+                        await self._emit_chunk(speech_frames, speech_start,
                                                now)
-                        speech_buffer = bytearray()
+                        speech_frames = []
                         speech_start = now
 
                 elif in_speech:
-                    speech_buffer.extend(pcm_data)
+                    speech_frames.append(pcm_data)
                     if silence_start == 0.0:
                         silence_start = now
 
                     if now - silence_start >= self.silence_timeout:
                         duration = now - speech_start
                         if duration >= self.min_speech_duration:
-                            await self._emit_chunk(speech_buffer, speech_start,
+                            await self._emit_chunk(speech_frames, speech_start,
                                                    now)
                         else:
                             log.debug("Speech too short (%.1fs), discarded",
                                       duration)
-                        speech_buffer = bytearray()
+                        speech_frames = []
                         in_speech = False
                         silence_start = 0.0
 
@@ -144,16 +147,17 @@ class AudioCapture:
             stream.close()
             log.info("Audio capture stopped")
 
-    async def _emit_chunk(self, buffer: bytearray, start: float,
+    async def _emit_chunk(self, frames: list[bytes], start: float,
                           end: float) -> None:
         """Package and send a completed speech segment."""
         duration = end - start
+        pcm = b"".join(frames)
         chunk = AudioChunk(
-            pcm_data=bytes(buffer),
+            pcm_data=pcm,
             sample_rate=self.sample_rate,
             duration_s=duration,
             timestamp=start,
         )
-        log.info("Speech chunk: %.1fs, %d bytes", duration, len(buffer))
+        log.info("Speech chunk: %.1fs, %d bytes", duration, len(pcm))
         if self.send_callback:
             await self.send_callback(chunk)